@@ -1,18 +1,46 @@
 import streamlit as st
-from openai import OpenAI
 from datetime import datetime, date
+import asyncio
+import collections
+import copy
 import hashlib
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional
+import importlib.util
+import io
+import sys
 import xml.etree.ElementTree as ET
 from urllib.request import urlopen
 import json
-import pandas as pd
+import string
 import time
 
-from feasibility import compute_outputs, sensitivity, DEFAULTS, DAIRE_TIPLERI
-from pdf_report import build_pdf
-from excel_export import create_excel_report, create_comparison_excel
-from formatters import fmt_int, fmt_usd, fmt_try, fmt_pct, fmt_m2
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+from feasibility import compute_outputs, sensitivity, DEFAULTS, DAIRE_TIPLERI, FeasibilityOutputs, Scenario
+from formatters import fmt_int, fmt_int_array, fmt_usd, fmt_try, fmt_pct, fmt_m2
+
+def _lazy_import(name: str):
+    """Return a module proxy that runs the real import of `name` on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+pd = _lazy_import("pandas")
 
 # ============================================================================
 # CONFIGURATION & CONSTANTS
@@ -20,7 +48,15 @@ from formatters import fmt_int, fmt_usd, fmt_try, fmt_pct, fmt_m2
 APP_TITLE = "AI Konut Fizibilite Asistani"
 APP_SUBTITLE = "Hizli, Akilli, Profesyonel Analiz"
 DEFAULT_DAILY_LIMIT = 100  # Updated: 100 hesaplama/kullanıcı/gün
+CHAT_VISIBLE_MESSAGES = 20  # Sohbette her calistirmada cizilen son mesaj sayisi
+CHAT_PROGRESS_INTERVAL_SECONDS = 0.1  # Akis sirasinda ilerleme mesajinin en sik guncellenme araligi
+LLM_MAX_CONCURRENCY = 8  # Ayni anda en fazla 8 OpenAI istegi (rate limit)
+LLM_CACHE_TTL_SECONDS = 60 * 60
+LLM_CACHE_MAX_ENTRIES = 512
 TCMB_URL = "https://www.tcmb.gov.tr/kurlar/today.xml"
+TCMB_TTL_SECONDS = 60 * 30
+TCMB_WAIT_SECONDS = 0.05  # Eski kur varken render en fazla bu kadar bekler
+TCMB_REFRESH_SECONDS = 60 * 25  # Arka plan yenilemesi TTL dolmadan once calisir
 
 # Modern color scheme
 PRIMARY_COLOR = "#1E3A8A"
@@ -61,12 +97,18 @@ EXAMPLE_SCENARIOS = {
 # HELPER FUNCTIONS (Formatting now in formatters.py)
 # ============================================================================
 
-def get_client() -> OpenAI:
+def get_api_key() -> str:
     api_key = st.secrets.get("OPENAI_API_KEY", None)
     if not api_key:
         st.error("🔑 OPENAI_API_KEY eksik. Streamlit Secrets'e eklemelisin.")
         st.stop()
-    return OpenAI(api_key=api_key)
+    return api_key
+
+def get_client() -> "AsyncOpenAI":
+    # Not cached: the async HTTP pool is bound to the event loop of the
+    # asyncio.run() call that uses it, so each batch gets its own client.
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=get_api_key())
 
 def stable_user_key() -> str:
     try:
@@ -75,11 +117,20 @@ def stable_user_key() -> str:
     except Exception:
         xf, ua = "", ""
     base = (xf or "") + "|" + (ua or "") + "|" + st.session_state.get("session_fallback", "fallback")
-    return hashlib.sha256(base.encode("utf-8")).hexdigest()[:16]
+    return hashlib.blake2b(base.encode("utf-8"), digest_size=8).hexdigest()
+
+QUOTA_SHARDS = 16  # power of two, shard = hash(key) & (QUOTA_SHARDS - 1)
 
 @st.cache_resource
 def usage_store():
-    return {"day": date.today().isoformat(), "counts": {}}
+    # Shared by every session in the process: each shard has its own lock so
+    # concurrent users only contend when their keys land in the same bucket.
+    return {
+        "day": date.today().isoformat(),
+        "day_lock": threading.Lock(),
+        "locks": [threading.Lock() for _ in range(QUOTA_SHARDS)],
+        "counts": [collections.Counter() for _ in range(QUOTA_SHARDS)],
+    }
 
 def check_and_increment_quota() -> tuple[bool, int, int]:
     """
@@ -91,8 +142,12 @@ def check_and_increment_quota() -> tuple[bool, int, int]:
     store = usage_store()
     today = date.today().isoformat()
     if store["day"] != today:
-        store["day"] = today
-        store["counts"] = {}
+        with store["day_lock"]:
+            if store["day"] != today:
+                for lock, counts in zip(store["locks"], store["counts"]):
+                    with lock:
+                        counts.clear()
+                store["day"] = today
     key = stable_user_key()
     limit = int(st.secrets.get("DAILY_LIMIT", DEFAULT_DAILY_LIMIT))
     
@@ -100,25 +155,41 @@ def check_and_increment_quota() -> tuple[bool, int, int]:
     if limit >= 1000:
         return True, 999999, 999999
     
-    count = store["counts"].get(key, 0)
-    remaining = max(0, limit - count)
-    if count >= limit:
-        return False, 0, limit
-    store["counts"][key] = count + 1
-    return True, remaining - 1, limit
+    shard = hash(key) & (QUOTA_SHARDS - 1)
+    counts = store["counts"][shard]
+    with store["locks"][shard]:
+        count = counts[key]
+        if count >= limit:
+            return False, 0, limit
+        counts[key] = count + 1
+    return True, limit - count - 1, limit
+
+_DEFAULT_FILLERS = (
+    ("satilabilir_katsayi", DEFAULTS["satilabilir_katsayi"]),
+    ("ortalama_konut_m2", DEFAULTS["ortalama_konut_m2"]),
+)
 
-def ensure_defaults(inputs: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(inputs)
-    out.setdefault("satilabilir_katsayi", DEFAULTS["satilabilir_katsayi"])
-    out.setdefault("ortalama_konut_m2", DEFAULTS["ortalama_konut_m2"])
-    if out.get("otopark_tipi") in ["ACIK", "KAPALI"] and "otopark_katsayi" not in out:
-        out["otopark_katsayi"] = DEFAULTS["otopark_katsayi"][out["otopark_tipi"]]
-    if out.get("konut_sinifi") in ["ALT", "ORTA", "YUKSEK"] and "insaat_maliyet_usd_m2" not in out:
-        out["insaat_maliyet_usd_m2"] = DEFAULTS["insaat_maliyet_usd_m2"][out["konut_sinifi"]]
+# (selector field, selector value) -> (dependent field, default)
+_COND_DEFAULTS = {
+    **{("otopark_tipi", t): ("otopark_katsayi", v) for t, v in DEFAULTS["otopark_katsayi"].items()},
+    **{("konut_sinifi", c): ("insaat_maliyet_usd_m2", v) for c, v in DEFAULTS["insaat_maliyet_usd_m2"].items()},
+}
+_COND_SELECTORS = ("otopark_tipi", "konut_sinifi")
+
+def _fill_defaults(out: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill defaults into `out` in place; callers must pass a dict they own."""
+    for k, default in _DEFAULT_FILLERS:
+        out.setdefault(k, default)
+    for sel in _COND_SELECTORS:
+        cd = _COND_DEFAULTS.get((sel, out.get(sel)))
+        if cd:
+            out.setdefault(*cd)
     return out
 
-@st.cache_data(ttl=60 * 30)
-def fetch_usd_try_from_tcmb() -> Dict[str, Optional[str]]:
+def ensure_defaults(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return _fill_defaults(inputs.copy())
+
+def _fetch_tcmb() -> Dict[str, Optional[str]]:
     try:
         with urlopen(TCMB_URL, timeout=10) as r:
             xml_bytes = r.read()
@@ -146,6 +217,71 @@ def fetch_usd_try_from_tcmb() -> Dict[str, Optional[str]]:
     except Exception:
         return {"rate": None, "date": None, "source": "TCMB today.xml"}
 
+@st.cache_resource
+def tcmb_store():
+    """Process-wide TCMB state: one background fetch at a time, last good value kept."""
+    return {
+        "lock": threading.Lock(),
+        "executor": ThreadPoolExecutor(max_workers=1, thread_name_prefix="tcmb"),
+        "future": None,
+        "started": 0.0,
+        "last": None,
+    }
+
+def _submit_tcmb(store: Dict[str, Any]):
+    """Start a background fetch; the caller must hold store["lock"]."""
+    def _keep(f):
+        res = f.result()
+        if res["rate"] is not None:
+            store["last"] = res
+    fut = store["future"] = store["executor"].submit(_fetch_tcmb)
+    store["started"] = time.time()
+    fut.add_done_callback(_keep)
+    return fut
+
+@st.cache_resource
+def tcmb_prewarm() -> bool:
+    """
+    Primes the rate once per process at startup and refreshes it on a timer,
+    so visitors never wait on the network, not even the first one.
+    """
+    store = tcmb_store()
+
+    def _tick():
+        with store["lock"]:
+            fut = store["future"]
+            if fut is None or fut.done():
+                _submit_tcmb(store)
+        timer = threading.Timer(TCMB_REFRESH_SECONDS, _tick)
+        timer.daemon = True
+        timer.start()
+
+    _tick()
+    return True
+
+def fetch_usd_try_from_tcmb() -> Dict[str, Optional[str]]:
+    """
+    Returns the USD/TRY rate without blocking the render on the network.
+    The fetch runs on a background thread (primed by tcmb_prewarm); while it
+    is in flight the last good value is served. Only a cold process waits.
+    """
+    store = tcmb_store()
+    with store["lock"]:
+        fut = store["future"]
+        if fut is None or (fut.done() and time.time() - store["started"] > TCMB_TTL_SECONDS):
+            fut = _submit_tcmb(store)
+        last = store["last"]
+
+    try:
+        res = fut.result(timeout=TCMB_WAIT_SECONDS if last else None)
+    except FutureTimeout:
+        return last
+
+    if res["rate"] is not None:
+        store["last"] = res
+        return res
+    return last or res
+
 # ============================================================================
 # LLM INTEGRATION
 # ============================================================================
@@ -203,53 +339,333 @@ Kritik akis:
 Kurallar:
 - Matematiksel hesap yapma. Arayuz sonuc paneli hesaplayacak.
 - patch_inputs tool'u ile sadece patch uret.
+- Birden fazla mesaj "---" ile ayrilmis gelebilir; hepsini tek patch'te birlestir, celiskide sonuncusu gecerli.
 Dil: Turkce, net, premium ton (kisa, maddeli).
 """
 
-def llm_extract_patch(client: OpenAI, user_text: str, current_inputs: Dict[str, Any]) -> Dict[str, Any]:
+# Sabit referans blogu: AGENT_SYSTEM ile birlikte her istekte birebir ayni
+# onek olusturur. OpenAI prompt caching yalnizca >=1024 token'lik onekleri
+# onbellege aldigi icin bu blok oneki esigin uzerine tasir; degisken kisim
+# (mevcut inputs, kullanici mesaji) her zaman sonraki mesajlarda gelir.
+AGENT_REFERENCE = f"""
+Alan sozlugu (patch anahtarlari):
+- arsa_alani_m2: Parselin toplam alani, m². Tipik aralik 200 - 50.000. 100'un altindaysa teyit iste.
+- emsal: Kat alani katsayisi (KAKS). Tipik aralik 0.3 - 3.0. 5'in uzerindeyse teyit iste.
+- satilabilir_katsayi: Emsal alanina gore satilabilir alan carpani. Varsayilan {DEFAULTS["satilabilir_katsayi"]}.
+- otopark_tipi: "ACIK" veya "KAPALI". "Acik otopark", "yer ustu" -> ACIK; "kapali", "bodrum", "yer alti" -> KAPALI.
+- otopark_katsayi: Toplam insaat alani carpani. Varsayilan ACIK icin {DEFAULTS["otopark_katsayi"]["ACIK"]}, KAPALI icin {DEFAULTS["otopark_katsayi"]["KAPALI"]}.
+  Kullanici acikca soylemedikce gonderme; otopark_tipi'nden turetilir.
+- konut_sinifi: "ALT", "ORTA" veya "YUKSEK". "Ekonomik", "sosyal konut" -> ALT; "standart" -> ORTA; "lux", "premium" -> YUKSEK.
+- insaat_maliyet_usd_m2: Birim insaat maliyeti, $/m². Varsayilan ALT {DEFAULTS["insaat_maliyet_usd_m2"]["ALT"]},
+  ORTA {DEFAULTS["insaat_maliyet_usd_m2"]["ORTA"]}, YUKSEK {DEFAULTS["insaat_maliyet_usd_m2"]["YUKSEK"]}.
+  Kullanici acikca soylemedikce gonderme; konut_sinifi'ndan turetilir.
+- arsa_toplam_degeri_usd: Arsanin toplam degeri, USD. TL verilirse USD'ye cevirme; teyit iste.
+- satis_birim_fiyat_usd_m2: Satilabilir m² basina satis fiyati, $/m². Ilk turda isteme.
+- ortalama_konut_m2: Ortalama daire buyuklugu, m². Varsayilan {DEFAULTS["ortalama_konut_m2"]}.
+  Daire tipi verilirse standart degerleri kullan: {", ".join(f"{k}={v}" for k, v in DAIRE_TIPLERI.items())}.
+
+Sayi yazimi:
+- "1.500" ve "1,500" ayni sayidir (bin bir yuz degil, bin bes yuz). "1,5" ondaliktir.
+- "2 milyon", "2M", "2 mio" -> 2000000. "750 bin", "750k" -> 750000.
+- Birim yoksa baglamdan cikar; emin degilsen patch'e ekleme, next_questions'a soru yaz.
+
+Ornekler:
+Kullanici: "1000 m2 arsa, emsal 2, kapali otopark, orta sinif, arsa 1.5 milyon dolar"
+patch: {{"arsa_alani_m2": 1000, "emsal": 2, "otopark_tipi": "KAPALI", "konut_sinifi": "ORTA", "arsa_toplam_degeri_usd": 1500000}}
+next_questions: ["Hangi satis fiyatiyla calisalim?"]
+
+Kullanici: "Satis fiyatini 2500 dolar yapalim"
+patch: {{"satis_birim_fiyat_usd_m2": 2500}}
+explanations: ["Satis fiyati 2.500 $/m² olarak guncellendi."]
+
+Kullanici: "Emsal 8"
+patch: {{}}
+confirmations: ["Emsal 8 olagan disi yuksek; dogru mu?"]
+
+Kullanici: "Daireler 3+1 olsun, lux proje"
+patch: {{"ortalama_konut_m2": {DAIRE_TIPLERI["3+1"]}, "konut_sinifi": "YUKSEK"}}
+"""
+
+# Onbellege alinabilir sabit onek; degismedigi surece tum isteklerde birebir aynidir
+AGENT_SYSTEM_PREFIX = AGENT_SYSTEM + AGENT_REFERENCE
+
+# Built once and shared by every request instead of re-creating the list/dict per call
+_PARSE_TOOLS = [PARSE_TOOL]
+_SYSTEM_PREFIX_MESSAGE = {"role": "system", "content": AGENT_SYSTEM_PREFIX}
+
+# Bump when the meaning of cached tool results changes without a prompt/schema edit
+LLM_PROMPT_VERSION = "2"
+
+# Covers the system prefix and the tool schema, so editing either invalidates cached results
+_LLM_PROMPT_HASH = hashlib.blake2b(
+    "\x1f".join([LLM_PROMPT_VERSION, AGENT_SYSTEM_PREFIX, json.dumps(PARSE_TOOL, sort_keys=True)]).encode("utf-8"),
+    digest_size=16,
+).hexdigest()
+
+@st.cache_resource
+def llm_cache_store():
+    """Process-wide exact-match cache of tool-call results: key -> (timestamp, data)."""
+    return {"lock": threading.Lock(), "entries": {}}
+
+def _json_loads(raw: str) -> Any:
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+def _json_dumps_sorted(obj: Any) -> str:
+    """Canonical (sorted-key) JSON text, used for hashing."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(obj, sort_keys=True, default=str)
+
+def _llm_cache_key(model: str, user_text: str, current_inputs: Dict[str, Any]) -> str:
+    inputs_json = _json_dumps_sorted(current_inputs)
+    prompt = "\x1f".join([model, _LLM_PROMPT_HASH, inputs_json, user_text])
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+_PATCH_RESULT_LISTS = ("explanations", "next_questions", "confirmations")
+
+def _is_patch_result(data: Any) -> bool:
+    """Shape check for a patch_inputs result (what the tool schema guarantees)."""
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get("patch"), dict)
+        and all(isinstance(data.get(k), list) for k in _PATCH_RESULT_LISTS)
+    )
+
+def _llm_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    store = llm_cache_store()
+    with store["lock"]:
+        hit = store["entries"].get(key)
+        if hit is None:
+            return None
+        ts, data = hit
+        # Expired or malformed entries are evicted and the caller makes a live call
+        if time.time() - ts > LLM_CACHE_TTL_SECONDS or not _is_patch_result(data):
+            del store["entries"][key]
+            return None
+        return data
+
+def _llm_cache_set(key: str, data: Dict[str, Any]) -> None:
+    store = llm_cache_store()
+    with store["lock"]:
+        entries = store["entries"]
+        entries.pop(key, None)
+        entries[key] = (time.time(), data)
+        while len(entries) > LLM_CACHE_MAX_ENTRIES:
+            del entries[next(iter(entries))]
+
+async def llm_extract_patch(
+    client: "AsyncOpenAI",
+    user_text: str,
+    current_inputs: Dict[str, Any],
+    user_id: Optional[str] = None,
+    on_delta: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """on_delta, if given, receives each streamed fragment of the tool-call arguments."""
+    model = st.secrets.get("OPENAI_MODEL", "gpt-4o-mini")
+    cache_key = _llm_cache_key(model, user_text, current_inputs)
+    cached = _llm_cache_get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
     try:
-        resp = client.chat.completions.create(
-            model=st.secrets.get("OPENAI_MODEL", "gpt-4o-mini"),
+        stream = await client.chat.completions.create(
+            model=model,
+            # Static prefix first so repeated calls hit OpenAI's prompt cache
             messages=[
-                {"role": "system", "content": AGENT_SYSTEM},
-                {"role": "user", "content": f"Mevcut inputs: {current_inputs}\n\nKullanici mesaji: {user_text}"}
+                _SYSTEM_PREFIX_MESSAGE,
+                {"role": "system", "content": f"Mevcut inputs: {_json_dumps_sorted(current_inputs)}"},
+                {"role": "user", "content": user_text}
             ],
-            tools=[PARSE_TOOL],
+            tools=_PARSE_TOOLS,
             tool_choice="required",
-            temperature=0.2
+            temperature=0.2,
+            stream=True,
+            **({"user": user_id} if user_id else {})
         )
-        msg = resp.choices[0].message
-        if not msg.tool_calls:
+        # Tool-call arguments arrive as string fragments; join them as they stream in
+        parts: List[str] = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            for tc in delta.tool_calls or ():
+                if tc.index == 0 and tc.function and tc.function.arguments:
+                    parts.append(tc.function.arguments)
+                    if on_delta:
+                        on_delta(tc.function.arguments)
+        if not parts:
             return {"patch": {}, "explanations": [], "next_questions": ["Tekrar dener misin?"], "confirmations": []}
         
-        tool_call = msg.tool_calls[0]
-        data = json.loads(tool_call.function.arguments)
+        data = _json_loads("".join(parts))
+        if _is_patch_result(data):
+            _llm_cache_set(cache_key, copy.deepcopy(data))
         return data
     except Exception as e:
         st.error(f"LLM hatasi: {str(e)}")
         return {"patch": {}, "explanations": [], "next_questions": [], "confirmations": []}
 
+def run_patches(
+    texts: List[str],
+    inputs: Dict[str, Any],
+    on_delta: Optional[Callable[[str], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Run independent extraction calls concurrently; results keep the order of `texts`."""
+    # Resolved here, outside the event loop, since it reads request headers
+    user_id = "quota_" + stable_user_key()
+
+    async def _gather():
+        sem = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        async with get_client() as client:
+            async def _one(text: str) -> Dict[str, Any]:
+                async with sem:
+                    return await llm_extract_patch(client, text, inputs, user_id, on_delta)
+            return await asyncio.gather(*[_one(t) for t in texts])
+    return asyncio.run(_gather())
+
 def merge_patch(inputs: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
-    merged = dict(inputs)
-    for k, v in patch.items():
-        merged[k] = v
-    return ensure_defaults(merged)
+    # `|` already returns a fresh dict, so defaults are filled without a second copy
+    return _fill_defaults(inputs | patch)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _compute_cached(inputs_json: str, usd_try_rate: Optional[float]) -> Dict[str, Any]:
+    outputs, warnings = compute_outputs(_json_loads(inputs_json), usd_try_rate=usd_try_rate)
+    return {"outputs": outputs, "warnings": warnings}
 
 def compute_if_possible(inputs: Dict[str, Any], usd_try_rate: Optional[float]):
     must = ["arsa_alani_m2", "emsal", "otopark_tipi", "konut_sinifi", "arsa_toplam_degeri_usd"]
     if not all(k in inputs and inputs[k] not in [None, ""] for k in must):
         return None
-    outputs, warnings = compute_outputs(inputs, usd_try_rate=usd_try_rate)
-    return {"outputs": outputs, "warnings": warnings}
+    # Canonical key: same inputs in any order share an entry; FX jitter below 1e-4 is ignored
+    rate = round(usd_try_rate, 4) if usd_try_rate is not None else None
+    return _compute_cached(_json_dumps_sorted(inputs), rate)
+
+# Report builders take the canonical inputs/outputs, the rate and the day (the
+# reports print today's date). PDF/Excel run on report_executor threads, which
+# have no script run context, so they stay uncached; the future kept in
+# session_state is their cache.
+def _pdf_bytes(inputs_json: str, outputs_json: str, warnings: List[str], usd_try_rate: Optional[float], day: str) -> bytes:
+    from pdf_report import build_pdf
+    buf = io.BytesIO()
+    build_pdf(
+        path=buf,
+        project_title="Konut Projesi Fizibilite",
+        inputs=_json_loads(inputs_json),
+        outputs=_json_loads(outputs_json),
+        warnings=warnings,
+        usd_try_rate=usd_try_rate,
+        rate_source="TCMB today.xml" if usd_try_rate else None,
+    )
+    return buf.getvalue()
+
+def _excel_bytes(
+    inputs_json: str,
+    outputs_json: str,
+    warnings: List[str],
+    usd_try_rate: Optional[float],
+    day: str,
+    report_format: str = "xlsx",
+) -> bytes:
+    """report_format="csv" writes the same tables without openpyxl (no styling/charts)"""
+    from excel_export import create_csv_report, create_excel_report
+    buf = io.BytesIO()
+    create = create_csv_report if report_format == "csv" else create_excel_report
+    create(
+        filepath=buf,
+        project_title="Konut Projesi Fizibilite",
+        inputs=_json_loads(inputs_json),
+        outputs=_json_loads(outputs_json),
+        warnings=warnings,
+        usd_try_rate=usd_try_rate,
+        rate_source="TCMB today.xml" if usd_try_rate else None,
+    )
+    return buf.getvalue()
+
+# The CSV is built inline on every rerun that shows the buttons, so it is cached
+@st.cache_data(max_entries=32, show_spinner=False)
+def _csv_bytes(
+    inputs_json: str,
+    outputs_json: str,
+    warnings: List[str],
+    usd_try_rate: Optional[float],
+    day: str,
+) -> bytes:
+    return _excel_bytes(inputs_json, outputs_json, warnings, usd_try_rate, day, report_format="csv")
+
+@st.cache_resource
+def report_executor() -> ThreadPoolExecutor:
+    """Process-wide pool so PDF and Excel builds can run side by side."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="report")
+
+def render_report_download(
+    state_key: str,
+    report_args: tuple,
+    spinner_text: str,
+    label: str,
+    file_name: str,
+    mime: str,
+    key: str,
+) -> None:
+    """Download button for a report future in session_state, if it was built for `report_args`."""
+    entry = st.session_state.get(state_key)
+    if not entry or entry[0] != report_args:
+        return
+    fut = entry[1]
+    try:
+        if fut.done():
+            data = fut.result()
+        else:
+            with st.spinner(spinner_text):
+                data = fut.result()
+    except Exception as e:
+        st.session_state.pop(state_key, None)
+        st.error(f"Rapor olusturulamadi: {e}")
+        return
+    st.download_button(label, data=data, file_name=file_name, mime=mime, use_container_width=True, key=key)
+
+def summary_lines(
+    outs: FeasibilityOutputs,
+    warns: List[str],
+    explanations: List[str] = (),
+    confirmations: List[str] = (),
+) -> List[str]:
+    """Markdown lines of the chat summary shown after inputs change."""
+    lines = []
+    if explanations:
+        lines.append("**Anladiklarim**")
+        lines += [f"- {e}" for e in explanations]
+    if confirmations:
+        lines.append("\n**Kabuller**")
+        lines += [f"- {c}" for c in confirmations]
+
+    lines.append("\n**Hizli Ozet**")
+    lines.append(f"- Satilabilir alan: **{fmt_int(outs.get('satilabilir_alan_m2'))} m²**")
+    lines.append(f"- Toplam proje maliyeti: **{fmt_usd(outs.get('toplam_proje_maliyeti_usd'))}** / **{fmt_try(outs.get('toplam_proje_maliyeti_try'))}**")
+    lines.append(f"- Basabas satis: **{fmt_int(outs.get('breakeven_usd_m2'))} $/m²** / **{fmt_int(outs.get('breakeven_try_m2'))} ₺/m²**")
+
+    lines.append("\n**Hedef Satis Fiyatlari (Brut karlilik)**")
+    lines.append(f"- %10: **{fmt_int(outs.get('target_10_usd_m2'))} $/m²** / **{fmt_int(outs.get('target_10_try_m2'))} ₺/m²**")
+    lines.append(f"- %30: **{fmt_int(outs.get('target_30_usd_m2'))} $/m²** / **{fmt_int(outs.get('target_30_try_m2'))} ₺/m²**")
+    lines.append(f"- %50: **{fmt_int(outs.get('target_50_usd_m2'))} $/m²** / **{fmt_int(outs.get('target_50_try_m2'))} ₺/m²**")
+
+    if not outs.get("satis_birim_fiyat_usd_m2"):
+        lines.append("\nSimdi hangi **satis fiyatiyla** calisalim? (örn: **2200 $/m²** veya **95.000 ₺/m²**)")
+
+    if warns:
+        lines.append("\n**Notlar/Uyarilar**")
+        lines += [f"- {w}" for w in warns]
+    return lines
+
+def scenario_loaded_message(name: str, inputs: Dict[str, Any], usd_try_rate: Optional[float]) -> Optional[str]:
+    """Canonical assistant reply for a loaded example scenario, built locally without an LLM call."""
+    result = compute_if_possible(inputs, usd_try_rate)
+    if not result:
+        return None
+    return "\n".join([f"**{name}** yuklendi."] + summary_lines(result["outputs"], result["warnings"]))
 
 # ============================================================================
 # MODERN UI COMPONENTS
 # ============================================================================
-def render_metric_card(label: str, value: str, delta: Optional[str] = None, icon: str = "📊"):
-    """Render a beautiful metric card"""
-    delta_html = f"<div style='font-size: 0.8em; color: #64748B; margin-top: 4px;'>{delta}</div>" if delta else ""
-    
-    st.markdown(f"""
+_CARD_TPL = string.Template("""
     <div style='
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         padding: 20px;
@@ -257,72 +673,161 @@ def render_metric_card(label: str, value: str, delta: Optional[str] = None, icon
         box-shadow: 0 4px 6px rgba(0,0,0,0.1);
         color: white;
     '>
-        <div style='font-size: 2em; margin-bottom: 8px;'>{icon}</div>
-        <div style='font-size: 0.9em; opacity: 0.9; text-transform: uppercase; letter-spacing: 1px;'>{label}</div>
-        <div style='font-size: 1.8em; font-weight: bold; margin-top: 8px;'>{value}</div>
-        {delta_html}
+        <div style='font-size: 2em; margin-bottom: 8px;'>$icon</div>
+        <div style='font-size: 0.9em; opacity: 0.9; text-transform: uppercase; letter-spacing: 1px;'>$label</div>
+        <div style='font-size: 1.8em; font-weight: bold; margin-top: 8px;'>$value</div>
+        $delta
     </div>
-    """, unsafe_allow_html=True)
+    """)
+# Single-line variant so several cards can share one markdown block without
+# blank lines ending the HTML early
+_CARD_INLINE_TPL = string.Template(
+    " ".join(line.strip() for line in _CARD_TPL.template.splitlines() if line.strip())
+)
+_KPI_GRID_TPL = string.Template(
+    "<div style='display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px;'>$cards</div>"
+)
+_CARD_DELTA_TPL = string.Template("<div style='font-size: 0.8em; color: #64748B; margin-top: 4px;'>$delta</div>")
 
-def render_progress_bar(percentage: float, label: str):
-    """Render a colorful progress bar"""
-    color = SUCCESS_COLOR if percentage > 30 else WARNING_COLOR if percentage > 10 else DANGER_COLOR
-    st.markdown(f"""
+_PROGRESS_TPL = string.Template("""
     <div style='margin: 10px 0;'>
         <div style='display: flex; justify-content: space-between; margin-bottom: 4px;'>
-            <span style='font-size: 0.9em; color: #64748B;'>{label}</span>
-            <span style='font-size: 0.9em; font-weight: bold; color: {color};'>{percentage:.1f}%</span>
+            <span style='font-size: 0.9em; color: #64748B;'>$label</span>
+            <span style='font-size: 0.9em; font-weight: bold; color: $color;'>$pct_text%</span>
         </div>
         <div style='background: #E5E7EB; border-radius: 8px; height: 8px; overflow: hidden;'>
-            <div style='background: {color}; width: {percentage}%; height: 100%; transition: width 0.3s;'></div>
+            <div style='background: $color; width: $width%; height: 100%; transition: width 0.3s;'></div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
-def render_kpi_grid(outputs: Dict[str, Any]):
-    """Render KPI grid with beautiful cards"""
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        render_metric_card(
-            "Satilabilir Alan",
-            fmt_int(outputs.get('satilabilir_alan_m2')) + " m²",
-            icon="🏗️"
+_REVENUE_FLOW_TPL = string.Template(
+    "<div style='text-align: center; padding: 20px; background: linear-gradient(90deg, #10B981 0%, #3B82F6 50%, "
+    "#F59E0B 100%); border-radius: 8px; color: white; font-weight: bold;'>"
+    "Hasilat: $hasilat → Maliyet: $maliyet → Kar: $kar"
+    "</div>"
+)
+
+_HEADER_TPL = string.Template("""
+<div style='text-align: center; padding: 1rem 0 2rem 0;'>
+    <h1 style='
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        font-size: 2.5em;
+        font-weight: 700;
+        margin: 0;
+    '>$title</h1>
+    <p style='color: #64748B; font-size: 1.1em; margin-top: 0.5rem;'>$subtitle</p>
+</div>
+""")
+
+@st.cache_resource
+def _header_html() -> str:
+    return _HEADER_TPL.substitute(title=APP_TITLE, subtitle=APP_SUBTITLE)
+
+def render_metric_card(label: str, value: str, delta: Optional[str] = None, icon: str = "📊"):
+    """Render a beautiful metric card"""
+    delta_html = _CARD_DELTA_TPL.substitute(delta=delta) if delta else ""
+    st.markdown(_CARD_TPL.substitute(icon=icon, label=label, value=value, delta=delta_html), unsafe_allow_html=True)
+
+def render_progress_bar(percentage: float, label: str):
+    """Render a colorful progress bar"""
+    color = SUCCESS_COLOR if percentage > 30 else WARNING_COLOR if percentage > 10 else DANGER_COLOR
+    st.markdown(
+        _PROGRESS_TPL.substitute(label=label, color=color, pct_text=f"{percentage:.1f}", width=percentage),
+        unsafe_allow_html=True,
+    )
+
+# Every value the dashboard prints, grouped by formatter; formatted in one pass
+# per run and looked up as fo[(format, key)]
+_OUTPUT_FORMATS = (
+    ("int", fmt_int, (
+        "satilabilir_alan_m2", "kalan_satilabilir_alan_m2", "breakeven_usd_m2",
+        "breakeven_try_m2", "satis_birim_fiyat_usd_m2",
+    )),
+    ("usd", fmt_usd, (
+        "arsa_degeri_usd", "insaat_maliyeti_usd", "toplam_proje_maliyeti_usd",
+        "proje_hasilati_usd", "proje_kari_usd", "satis_birim_fiyat_usd_m2",
+    )),
+    ("try", fmt_try, ("toplam_proje_maliyeti_try", "satis_birim_fiyat_try_m2")),
+    ("pct", fmt_pct, ("brut_karlilik_orani", "breakeven_konut_orani")),
+)
+
+def _format_outputs(outs: FeasibilityOutputs) -> Dict[tuple, str]:
+    return {(name, k): fmt(outs.get(k)) for name, fmt, keys in _OUTPUT_FORMATS for k in keys}
+
+def render_kpi_grid(outputs: FeasibilityOutputs, fo: Dict[tuple, str], placeholder=None):
+    """Render KPI grid with beautiful cards (one markdown element for all four)"""
+    kar = outputs.proje_kari_usd
+    if kar and kar > 0:
+        last = ("Proje Kari", fo["usd", "proje_kari_usd"], f"Karlilik: {fo['pct', 'brut_karlilik_orani']}", "💎")
+    else:
+        last = (
+            "Basabas Fiyat",
+            fo["int", "breakeven_usd_m2"] + " $/m²",
+            fo["int", "breakeven_try_m2"] + " ₺/m²",
+            "⚖️",
         )
-    
-    with col2:
-        render_metric_card(
+    cards = (
+        ("Satilabilir Alan", fo["int", "satilabilir_alan_m2"] + " m²", None, "🏗️"),
+        (
             "Konut Adedi",
-            str(int(outputs.get('yaklasik_konut_adedi', 0))),
-            f"~{fmt_int(outputs.get('kalan_satilabilir_alan_m2'))} m² kalan",
-            icon="🏘️"
-        )
-    
-    with col3:
-        render_metric_card(
+            str(int(outputs.yaklasik_konut_adedi)),
+            f"~{fo['int', 'kalan_satilabilir_alan_m2']} m² kalan",
+            "🏘️",
+        ),
+        (
             "Toplam Maliyet",
-            fmt_usd(outputs.get('toplam_proje_maliyeti_usd')),
-            fmt_try(outputs.get('toplam_proje_maliyeti_try')),
-            icon="💰"
+            fo["usd", "toplam_proje_maliyeti_usd"],
+            fo["try", "toplam_proje_maliyeti_try"],
+            "💰",
+        ),
+        last,
+    )
+    html = _KPI_GRID_TPL.substitute(cards="".join(
+        _CARD_INLINE_TPL.substitute(
+            icon=icon, label=label, value=value,
+            delta=_CARD_DELTA_TPL.substitute(delta=delta) if delta else "",
         )
-    
-    with col4:
-        kar = outputs.get('proje_kari_usd')
-        karlilik = outputs.get('brut_karlilik_orani', 0)
-        if kar and kar > 0:
-            render_metric_card(
-                "Proje Kari",
-                fmt_usd(kar),
-                f"Karlilik: {fmt_pct(karlilik)}",
-                icon="💎"
-            )
-        else:
-            render_metric_card(
-                "Basabas Fiyat",
-                fmt_int(outputs.get('breakeven_usd_m2')) + " $/m²",
-                fmt_int(outputs.get('breakeven_try_m2')) + " ₺/m²",
-                icon="⚖️"
-            )
+        for label, value, delta, icon in cards
+    ))
+    # An st.empty() placeholder is overwritten in place instead of re-created
+    (placeholder or st).markdown(html, unsafe_allow_html=True)
+
+# Dashboard tables/charts are cached on plain tuples of the values they show,
+# so reruns with unchanged outputs skip rebuilding the DataFrames
+_PRICE_TARGET_LABELS = ["Basabas", "%10 Kar", "%30 Kar", "%50 Kar"]
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _price_chart_df(usd_prices: tuple) -> "pd.DataFrame":
+    return pd.DataFrame({"Hedef": _PRICE_TARGET_LABELS, "Fiyat": list(usd_prices)}).set_index("Hedef")
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _pricing_table_df(usd_prices: tuple, try_prices: tuple) -> "pd.DataFrame":
+    return pd.DataFrame({
+        "Hedef": _PRICE_TARGET_LABELS,
+        "USD/m²": fmt_int_array(usd_prices),
+        "TL/m²": fmt_int_array(try_prices),
+    })
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _daire_dfs(rows: tuple) -> tuple:
+    """rows: (tip, m2, fiyat_usd, fiyat_try) per apartment type -> (table, chart)"""
+    table = pd.DataFrame([
+        {
+            "Daire Tipi": tip,
+            "Brut Alan": fmt_m2(m2),
+            "Satis Fiyati (USD)": fmt_usd(usd),
+            "Satis Fiyati (TL)": fmt_try(try_) if try_ else "-",
+        }
+        for tip, m2, usd, try_ in rows
+    ])
+    chart = pd.DataFrame({
+        "Tip": [r[0] for r in rows],
+        "Fiyat (USD)": [r[2] for r in rows],
+    }).set_index("Tip")
+    return table, chart
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -333,9 +838,12 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+tcmb_prewarm()
 
 # Modern CSS
-st.markdown("""
+@st.cache_resource
+def _static_css() -> str:
+    return """
 <style>
     /* Hide Streamlit branding */
     #MainMenu {visibility: hidden;}
@@ -374,28 +882,22 @@ st.markdown("""
         margin: 0.5rem 0;
     }
     
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 8px 8px 0 0;
-        padding: 0.75rem 1.5rem;
-    }
-    
     /* Info boxes */
     .stAlert {
         border-radius: 8px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Streamlit clears any element that is not re-emitted on a rerun, so the
+# style block is sent every run; only building the string is cached.
+st.markdown(_static_css(), unsafe_allow_html=True)
 
 # ============================================================================
 # SESSION STATE INIT
 # ============================================================================
 if "session_fallback" not in st.session_state:
-    st.session_state.session_fallback = hashlib.sha256(str(datetime.now()).encode()).hexdigest()
+    st.session_state.session_fallback = hashlib.blake2b(str(datetime.now()).encode(), digest_size=16).hexdigest()
 
 if "inputs" not in st.session_state:
     st.session_state.inputs = ensure_defaults({})
@@ -403,25 +905,15 @@ if "messages" not in st.session_state:
     st.session_state.messages = []
 if "initialized" not in st.session_state:
     st.session_state.initialized = False
+if "pending_user_texts" not in st.session_state:
+    st.session_state.pending_user_texts = []  # Chat messages not yet sent to the LLM
 if "scenarios" not in st.session_state:
     st.session_state.scenarios = []  # For comparison mode
 
 # ============================================================================
 # HEADER
 # ============================================================================
-st.markdown(f"""
-<div style='text-align: center; padding: 1rem 0 2rem 0;'>
-    <h1 style='
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 2.5em;
-        font-weight: 700;
-        margin: 0;
-    '>{APP_TITLE}</h1>
-    <p style='color: #64748B; font-size: 1.1em; margin-top: 0.5rem;'>{APP_SUBTITLE}</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_header_html(), unsafe_allow_html=True)
 
 # ============================================================================
 # SIDEBAR - CURRENCY & QUOTA
@@ -465,6 +957,7 @@ with st.sidebar:
     if st.button("🔄 Yeni Hesaplama", use_container_width=True):
         st.session_state.inputs = ensure_defaults({})
         st.session_state.messages = []
+        st.session_state.pending_user_texts = []
         st.session_state.initialized = False
         st.rerun()
     
@@ -483,9 +976,11 @@ with st.sidebar:
     if scenario_name and scenario_name in EXAMPLE_SCENARIOS:
         if st.button("📥 Yukle", use_container_width=True, key="load_scenario"):
             st.session_state.inputs = ensure_defaults(EXAMPLE_SCENARIOS[scenario_name])
+            loaded_msg = scenario_loaded_message(scenario_name, st.session_state.inputs, usd_try_rate)
+            if loaded_msg:
+                st.session_state.messages.append({"role": "assistant", "content": loaded_msg})
+            # The sidebar runs before the tabs, so this same run already renders the new inputs
             st.success(f"✅ {scenario_name} yuklendi!")
-            time.sleep(0.5)
-            st.rerun()
     
     if st.button("📄 Son Raporu İndir", use_container_width=True, disabled=True):
         st.info("Henuz rapor olusturulmadi")
@@ -493,12 +988,18 @@ with st.sidebar:
 # ============================================================================
 # MAIN CONTENT - TABS
 # ============================================================================
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["💬 AI Asistan", "📊 Hızlı Hesap", "📈 Sonuçlar", "💰 Nakit Akış", "🏗️ Karma Kullanım", "📍 Piyasa Karşılaştırma"])
+# st.tabs executes every tab body on each run; a tab selector lets only the
+# visible section run (widgets of hidden sections fall back to their defaults)
+TAB_LABELS = ["💬 AI Asistan", "📊 Hızlı Hesap", "📈 Sonuçlar", "💰 Nakit Akış", "🏗️ Karma Kullanım", "📍 Piyasa Karşılaştırma"]
+active_tab = st.radio("Bolum", TAB_LABELS, horizontal=True, key="active_tab", label_visibility="collapsed")
 
-client = get_client()
+get_api_key()
+
+# Computed once per run for every tab; handlers that change the inputs refresh it
+result = compute_if_possible(st.session_state.inputs, usd_try_rate)
 
 # TAB 1: AI Chat Assistant
-with tab1:
+if active_tab == TAB_LABELS[0]:
     st.markdown("### AI Destekli Analiz")
     st.caption("Bilgilerinizi dogal dille yazin, AI size yardimci olsun")
     
@@ -516,53 +1017,57 @@ with tab1:
         )
         st.session_state.messages.append({"role": "assistant", "content": intro})
 
-    for m in st.session_state.messages:
+    # Only the latest messages are rendered every run; older ones are sent to
+    # the browser only while the toggle is on (an expander would still render them)
+    older = st.session_state.messages[:-CHAT_VISIBLE_MESSAGES]
+    if older and st.toggle(f"Onceki {len(older)} mesaji goster", key="show_older_messages"):
+        for m in older:
+            with st.chat_message(m["role"]):
+                st.markdown(m["content"])
+    for m in st.session_state.messages[-CHAT_VISIBLE_MESSAGES:]:
         with st.chat_message(m["role"]):
             st.markdown(m["content"])
 
     user_text = st.chat_input("Bilgileri yaz veya bir degeri guncelle...")
     if user_text:
         st.session_state.messages.append({"role": "user", "content": user_text})
-
-        data = llm_extract_patch(client, user_text, st.session_state.inputs)
+        st.session_state.pending_user_texts.append(user_text)
+
+    # Messages sent while an earlier request was still running (the run gets
+    # interrupted) stay queued and are extracted together in a single call
+    if st.session_state.pending_user_texts:
+        batched_text = "\n---\n".join(st.session_state.pending_user_texts)
+        # Live progress while the reply streams in; the rerun below replaces it
+        with st.chat_message("assistant"):
+            progress = st.empty()
+            progress.markdown("⏳ Mesajin isleniyor...")
+        streamed = {"chars": 0, "shown": time.monotonic()}
+
+        def _on_delta(fragment: str) -> None:
+            streamed["chars"] += len(fragment)
+            now = time.monotonic()
+            if now - streamed["shown"] >= CHAT_PROGRESS_INTERVAL_SECONDS:
+                streamed["shown"] = now
+                progress.markdown(f"⏳ Mesajin isleniyor... ({streamed['chars']} karakter alindi)")
+
+        data = run_patches([batched_text], st.session_state.inputs, on_delta=_on_delta)[0]
+        st.session_state.pending_user_texts = []
         patch = data.get("patch", {})
         explanations = data.get("explanations", [])
         confirmations = data.get("confirmations", [])
         next_qs = data.get("next_questions", [])
 
-        st.session_state.inputs = merge_patch(st.session_state.inputs, patch)
-
-        result = compute_if_possible(st.session_state.inputs, usd_try_rate)
+        # An empty patch (e.g. a clarifying question) leaves the inputs, and so
+        # the result computed before the tabs in this run, unchanged
+        if patch:
+            st.session_state.inputs = merge_patch(st.session_state.inputs, patch)
+            result = compute_if_possible(st.session_state.inputs, usd_try_rate)
 
         if result:
             outs = result["outputs"]
             warns = result["warnings"]
 
-            lines = []
-            if explanations:
-                lines.append("**Anladiklarim**")
-                lines += [f"- {e}" for e in explanations]
-            if confirmations:
-                lines.append("\n**Kabuller**")
-                lines += [f"- {c}" for c in confirmations]
-
-            lines.append("\n**Hizli Ozet**")
-            lines.append(f"- Satilabilir alan: **{fmt_int(outs.get('satilabilir_alan_m2'))} m²**")
-            lines.append(f"- Toplam proje maliyeti: **{fmt_usd(outs.get('toplam_proje_maliyeti_usd'))}** / **{fmt_try(outs.get('toplam_proje_maliyeti_try'))}**")
-            lines.append(f"- Basabas satis: **{fmt_int(outs.get('breakeven_usd_m2'))} $/m²** / **{fmt_int(outs.get('breakeven_try_m2'))} ₺/m²**")
-
-            lines.append("\n**Hedef Satis Fiyatlari (Brut karlilik)**")
-            lines.append(f"- %10: **{fmt_int(outs.get('target_10_usd_m2'))} $/m²** / **{fmt_int(outs.get('target_10_try_m2'))} ₺/m²**")
-            lines.append(f"- %30: **{fmt_int(outs.get('target_30_usd_m2'))} $/m²** / **{fmt_int(outs.get('target_30_try_m2'))} ₺/m²**")
-            lines.append(f"- %50: **{fmt_int(outs.get('target_50_usd_m2'))} $/m²** / **{fmt_int(outs.get('target_50_try_m2'))} ₺/m²**")
-
-            if not outs.get("satis_birim_fiyat_usd_m2"):
-                lines.append("\nSimdi hangi **satis fiyatiyla** calisalim? (örn: **2200 $/m²** veya **95.000 ₺/m²**)")
-
-            if warns:
-                lines.append("\n**Notlar/Uyarilar**")
-                lines += [f"- {w}" for w in warns]
-
+            lines = summary_lines(outs, warns, explanations, confirmations)
             st.session_state.messages.append({"role": "assistant", "content": "\n".join(lines)})
         else:
             ask = []
@@ -577,7 +1082,7 @@ with tab1:
         st.rerun()
 
 # TAB 2: Quick Calculator
-with tab2:
+if active_tab == TAB_LABELS[1]:
     st.markdown("### Hizli Hesaplama")
     st.caption("Formdan dogrudan giris yap")
     
@@ -679,26 +1184,25 @@ with tab2:
                 "ortalama_konut_m2": ort_konut,
                 "satis_birim_fiyat_usd_m2": (satis if satis > 0 else None),
             })
+            result = compute_if_possible(st.session_state.inputs, usd_try_rate)
             
             # Quota check - ONLY here, NOT in chat!
             success, remaining, total = check_and_increment_quota()
-            time.sleep(0.3)  # Visual feedback
         
         if not success:
             st.error(f"❌ Gunluk limit doldu ({total} hesaplama/gun)")
             st.info("💡 Yarin tekrar dene veya AI Asistan ile sinirsiz sohbet et!")
         else:
-            st.success(f"✅ Hesaplama tamamlandi! ({remaining} hesaplama kaldi)")
-            time.sleep(0.3)
+            # A toast survives the rerun, unlike an inline st.success
+            st.toast(f"Hesaplama tamamlandi! ({remaining} hesaplama kaldi)", icon="✅")
             st.rerun()
 
 # TAB 3: Results Dashboard
-with tab3:
-    result = compute_if_possible(st.session_state.inputs, usd_try_rate)
-    
+if active_tab == TAB_LABELS[2]:
     if result:
         outs = result["outputs"]
         warns = result["warnings"]
+        fo = _format_outputs(outs)
         
         st.markdown("### 📊 Proje Dashboard")
         
@@ -708,71 +1212,64 @@ with tab3:
         with col_btn1:
             if st.button("💾 Senaryoyu Kaydet", use_container_width=True):
                 scenario_name = f"Senaryo {len(st.session_state.scenarios) + 1}"
-                st.session_state.scenarios.append({
-                    "name": scenario_name,
-                    "inputs": dict(st.session_state.inputs),
-                    "outputs": dict(outs),
-                    "timestamp": datetime.now().isoformat()
-                })
-                st.success(f"✅ {scenario_name} kaydedildi!")
-                st.rerun()
+                st.session_state.scenarios.append(Scenario(
+                    name=scenario_name,
+                    inputs=dict(st.session_state.inputs),
+                    outputs=outs,
+                    timestamp=datetime.now().isoformat(),
+                ))
+                # Widgets below (clear button, comparison table) read the list later in this run
+                st.toast(f"{scenario_name} kaydedildi!", icon="✅")
         
         with col_btn2:
             if len(st.session_state.scenarios) > 0:
                 if st.button(f"🔄 Senaryolari Temizle ({len(st.session_state.scenarios)})", use_container_width=True):
                     st.session_state.scenarios = []
-                    st.rerun()
+                    st.toast("Senaryolar temizlendi", icon="🔄")
         
+        # Reports are built on click and kept in session_state, so the download
+        # button stays on the page (for these exact inputs) across reruns
+        report_args = (
+            _json_dumps_sorted(st.session_state.inputs),
+            _json_dumps_sorted(outs.to_dict()),
+            warns,
+            usd_try_rate,
+            date.today().isoformat(),
+        )
+
+        # Builds run on a shared pool: clicking PDF then Excel (which interrupts
+        # the first run) leaves the PDF building while the Excel one starts
         with col_btn3:
             if st.button("📄 PDF Rapor", use_container_width=True, type="primary"):
-                with st.spinner("PDF hazirlaniyor..."):
-                    pdf_path = "konut_fizibilite_raporu.pdf"
-                    build_pdf(
-                        path=pdf_path,
-                        project_title="Konut Projesi Fizibilite",
-                        inputs=st.session_state.inputs,
-                        outputs=outs,
-                        warnings=warns,
-                        usd_try_rate=usd_try_rate,
-                        rate_source="TCMB today.xml" if usd_try_rate else None,
-                    )
-                    with open(pdf_path, "rb") as f:
-                        st.download_button(
-                            "⬇️ PDF'i indir",
-                            data=f,
-                            file_name="konut_fizibilite_raporu.pdf",
-                            mime="application/pdf",
-                            use_container_width=True,
-                            key="pdf_download"
-                        )
-        
+                st.session_state["pdf_report"] = (report_args, report_executor().submit(_pdf_bytes, *report_args))
         with col_btn4:
             if st.button("📊 Excel Rapor", use_container_width=True, type="primary"):
-                with st.spinner("Excel hazirlaniyor..."):
-                    excel_path = "konut_fizibilite_raporu.xlsx"
-                    create_excel_report(
-                        filepath=excel_path,
-                        project_title="Konut Projesi Fizibilite",
-                        inputs=st.session_state.inputs,
-                        outputs=outs,
-                        warnings=warns,
-                        usd_try_rate=usd_try_rate,
-                        rate_source="TCMB today.xml" if usd_try_rate else None,
-                    )
-                    with open(excel_path, "rb") as f:
-                        st.download_button(
-                            "⬇️ Excel'i indir",
-                            data=f,
-                            file_name="konut_fizibilite_raporu.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            use_container_width=True,
-                            key="excel_download"
-                        )
+                st.session_state["excel_report"] = (report_args, report_executor().submit(_excel_bytes, *report_args))
+
+        with col_btn3:
+            render_report_download(
+                "pdf_report", report_args, "PDF hazirlaniyor...",
+                "⬇️ PDF'i indir", "konut_fizibilite_raporu.pdf", "application/pdf", "pdf_download",
+            )
+        with col_btn4:
+            render_report_download(
+                "excel_report", report_args, "Excel hazirlaniyor...",
+                "⬇️ Excel'i indir", "konut_fizibilite_raporu.xlsx",
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "excel_download",
+            )
+            st.download_button(
+                "⬇️ CSV olarak indir",
+                data=_csv_bytes(*report_args),
+                file_name="konut_fizibilite_raporu.csv",
+                mime="text/csv",
+                use_container_width=True,
+                key="csv_download",
+            )
         
         st.divider()
         
         # KPI Grid
-        render_kpi_grid(outs)
+        render_kpi_grid(outs, fo)
         
         st.divider()
         
@@ -782,51 +1279,22 @@ with tab3:
         with col_chart1:
             st.markdown("#### 💰 Maliyet Dagilimi")
             
-            # Pie Chart data
-            import pandas as pd
-            
-            chart_data = pd.DataFrame({
-                "Kategori": ['Arsa Degeri', 'Insaat Maliyeti'],
-                "Tutar": [
-                    outs.get('arsa_degeri_usd', 0),
-                    outs.get('insaat_maliyeti_usd', 0)
-                ]
-            })
-            
             # Display as metrics instead of chart (simpler)
-            total = outs.get('toplam_proje_maliyeti_usd', 1)
-            arsa_pct = (outs.get('arsa_degeri_usd', 0) / total * 100) if total > 0 else 0
-            insaat_pct = (outs.get('insaat_maliyeti_usd', 0) / total * 100) if total > 0 else 0
-            
-            st.metric("Arsa Degeri", fmt_usd(outs.get('arsa_degeri_usd')), f"{arsa_pct:.1f}%")
-            st.metric("Insaat Maliyeti", fmt_usd(outs.get('insaat_maliyeti_usd')), f"{insaat_pct:.1f}%")
+            st.metric("Arsa Degeri", fo["usd", "arsa_degeri_usd"], f"{outs.arsa_pct:.1f}%")
+            st.metric("Insaat Maliyeti", fo["usd", "insaat_maliyeti_usd"], f"{outs.insaat_pct:.1f}%")
             
-            render_progress_bar(arsa_pct, "Arsa Payi")
-            render_progress_bar(insaat_pct, "Insaat Payi")
+            render_progress_bar(outs.arsa_pct, "Arsa Payi")
+            render_progress_bar(outs.insaat_pct, "Insaat Payi")
         
         with col_chart2:
             st.markdown("#### 📈 Fiyat Karsilastirmasi")
             
             # Bar chart data
-            import pandas as pd
-            
-            categories = ['Basabas', '%10 Kar', '%30 Kar', '%50 Kar']
-            usd_prices = [
-                outs.get('breakeven_usd_m2', 0),
-                outs.get('target_10_usd_m2', 0),
-                outs.get('target_30_usd_m2', 0),
-                outs.get('target_50_usd_m2', 0),
-            ]
-            
-            chart_df = pd.DataFrame({
-                "Hedef": categories,
-                "Fiyat": usd_prices
-            })
-            
-            st.bar_chart(chart_df.set_index("Hedef"), height=300)
+            usd_prices = (outs.breakeven_usd_m2, outs.target_10_usd_m2, outs.target_30_usd_m2, outs.target_50_usd_m2)
+            st.bar_chart(_price_chart_df(usd_prices), height=300)
             
             # Current price indicator if exists
-            current_price = outs.get('satis_birim_fiyat_usd_m2', None)
+            current_price = outs.satis_birim_fiyat_usd_m2
             if current_price:
                 st.info(f"🎯 Secilen fiyat: **${current_price:,.0f}/m²**")
         
@@ -838,109 +1306,85 @@ with tab3:
         with col1:
             st.markdown("### 🎯 Satis Fiyat Stratejisi")
             
-            pricing_data = {
-                "Hedef": ["Basabas", "%10 Kar", "%30 Kar", "%50 Kar"],
-                "USD/m²": [
-                    fmt_int(outs.get('breakeven_usd_m2')),
-                    fmt_int(outs.get('target_10_usd_m2')),
-                    fmt_int(outs.get('target_30_usd_m2')),
-                    fmt_int(outs.get('target_50_usd_m2')),
-                ],
-                "TL/m²": [
-                    fmt_int(outs.get('breakeven_try_m2')),
-                    fmt_int(outs.get('target_10_try_m2')),
-                    fmt_int(outs.get('target_30_try_m2')),
-                    fmt_int(outs.get('target_50_try_m2')),
-                ],
-            }
-            st.dataframe(pricing_data, use_container_width=True, hide_index=True)
+            pricing_df = _pricing_table_df(
+                (outs.breakeven_usd_m2, outs.target_10_usd_m2, outs.target_30_usd_m2, outs.target_50_usd_m2),
+                (outs.breakeven_try_m2, outs.target_10_try_m2, outs.target_30_try_m2, outs.target_50_try_m2),
+            )
+            st.dataframe(pricing_df, use_container_width=True, hide_index=True)
         
         with col2:
             st.markdown("### 🏘️ Konut Bilgileri")
-            st.metric("Toplam Konut", f"{int(outs.get('yaklasik_konut_adedi') or 0)} adet")
+            st.metric("Toplam Konut", f"{int(outs.yaklasik_konut_adedi or 0)} adet")
             st.metric("Ortalama Buyukluk", f"{fmt_int(st.session_state.inputs.get('ortalama_konut_m2', 120))} m²")
-            st.metric("Kalan Alan", f"{fmt_int(outs.get('kalan_satilabilir_alan_m2'))} m²")
+            st.metric("Kalan Alan", f"{fo['int', 'kalan_satilabilir_alan_m2']} m²")
         
-        # Revenue section (if sales price exists)
-        if outs.get("satis_birim_fiyat_usd_m2"):
+        # Revenue section (only in revenue mode)
+        if outs.has_revenue:
             st.divider()
             st.markdown("### 💰 Gelir & Karlilik")
             
             col1, col2, col3, col4 = st.columns(4)
-            col1.metric("Satis Fiyati", f"{fmt_int(outs.get('satis_birim_fiyat_usd_m2'))} $/m²")
-            col2.metric("Hasilat (USD)", fmt_usd(outs.get("proje_hasilati_usd")))
-            col3.metric("Kar (USD)", fmt_usd(outs.get("proje_kari_usd")))
-            col4.metric("Brut Karlilik", fmt_pct(outs.get("brut_karlilik_orani")))
+            col1.metric("Satis Fiyati", f"{fo['int', 'satis_birim_fiyat_usd_m2']} $/m²")
+            col2.metric("Hasilat (USD)", fo["usd", "proje_hasilati_usd"])
+            col3.metric("Kar (USD)", fo["usd", "proje_kari_usd"])
+            col4.metric("Brut Karlilik", fo["pct", "brut_karlilik_orani"])
             
             # Profitability gauge
-            profit_margin = outs.get("brut_karlilik_orani", 0) * 100
-            render_progress_bar(profit_margin, "Karlilik Orani")
+            render_progress_bar(outs.profit_margin_pct, "Karlilik Orani")
             
             # Revenue breakdown visual
             st.markdown("#### 💵 Gelir Analizi")
             
             col_r1, col_r2, col_r3 = st.columns(3)
             
-            hasilat = outs.get("proje_hasilati_usd", 0)
-            maliyet = outs.get("toplam_proje_maliyeti_usd", 0)
-            kar = outs.get("proje_kari_usd", 0)
-            
-            col_r1.metric("1️⃣ Hasilat", fmt_usd(hasilat))
-            col_r2.metric("2️⃣ Maliyet", fmt_usd(maliyet), delta=f"-{fmt_usd(maliyet)}", delta_color="inverse")
-            col_r3.metric("3️⃣ Net Kar", fmt_usd(kar), delta=f"+{fmt_pct(outs.get('brut_karlilik_orani', 0))}")
+            col_r1.metric("1️⃣ Hasilat", fo["usd", "proje_hasilati_usd"])
+            col_r2.metric("2️⃣ Maliyet", fo["usd", "toplam_proje_maliyeti_usd"], delta=f"-{fo['usd', 'toplam_proje_maliyeti_usd']}", delta_color="inverse")
+            col_r3.metric("3️⃣ Net Kar", fo["usd", "proje_kari_usd"], delta=f"+{fo['pct', 'brut_karlilik_orani']}")
             
             # Simple flow visualization
-            st.markdown(f"""
-            <div style='text-align: center; padding: 20px; background: linear-gradient(90deg, #10B981 0%, #3B82F6 50%, #F59E0B 100%); border-radius: 8px; color: white; font-weight: bold;'>
-                Hasilat: {fmt_usd(hasilat)} → Maliyet: {fmt_usd(maliyet)} → Kar: {fmt_usd(kar)}
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(
+                _REVENUE_FLOW_TPL.substitute(
+                    hasilat=fo["usd", "proje_hasilati_usd"],
+                    maliyet=fo["usd", "toplam_proje_maliyeti_usd"],
+                    kar=fo["usd", "proje_kari_usd"],
+                ),
+                unsafe_allow_html=True,
+            )
         # Apartment Type Pricing Table
-        if outs.get("daire_fiyatlari"):
+        if outs.daire_fiyatlari:
             st.divider()
             st.markdown("### 🏠 Daire Tiplerine Gore Satis Fiyatlari")
             
-            st.caption(f"Birim fiyat: {fmt_usd(outs.get('satis_birim_fiyat_usd_m2'))} / {fmt_try(outs.get('satis_birim_fiyat_try_m2'))}")
+            st.caption(f"Birim fiyat: {fo['usd', 'satis_birim_fiyat_usd_m2']} / {fo['try', 'satis_birim_fiyat_try_m2']}")
             
             # Create dataframe
-            daire_data = []
-            for tip in ["1+1", "2+1", "3+1", "4+1"]:
-                if tip in outs["daire_fiyatlari"]:
-                    bilgi = outs["daire_fiyatlari"][tip]
-                    daire_data.append({
-                        "Daire Tipi": tip,
-                        "Brut Alan": fmt_m2(bilgi['m2']),
-                        "Satis Fiyati (USD)": fmt_usd(bilgi['fiyat_usd']),
-                        "Satis Fiyati (TL)": fmt_try(bilgi['fiyat_try']) if bilgi['fiyat_try'] else "-",
-                    })
-            
-            df = pd.DataFrame(daire_data)
+            daire_rows = tuple(
+                (tip, bilgi["m2"], bilgi["fiyat_usd"], bilgi["fiyat_try"])
+                for tip in DAIRE_TIPLERI
+                if (bilgi := outs.daire_fiyatlari.get(tip))
+            )
+            df, chart_df = _daire_dfs(daire_rows)
             st.dataframe(df, use_container_width=True, hide_index=True)
             
             # Bar chart
             st.markdown("#### 📊 Fiyat Karsilastirmasi")
             
-            chart_df = pd.DataFrame({
-                "Tip": [d["Daire Tipi"] for d in daire_data],
-                "Fiyat (USD)": [outs["daire_fiyatlari"][tip]["fiyat_usd"] for tip in ["1+1", "2+1", "3+1", "4+1"] if tip in outs["daire_fiyatlari"]]
-            })
-            
-            st.bar_chart(chart_df.set_index("Tip"), height=300)
+            st.bar_chart(chart_df, height=300)
             
             # Info message
             st.info("💡 Fiyatlar birim fiyat × brut alan olarak hesaplanmistir. Net alandan %15-20 fazladir.")
 
 # Break-even Analysis
-        if outs.get("breakeven_konut_adedi"):
+        if outs.breakeven_konut_adedi:
             st.divider()
             st.markdown("### 🎯 Break-Even Analizi")
             st.caption("Maliyeti karsilamak icin kac konut satilmali?")
             
             col1, col2, col3 = st.columns(3)
             
-            breakeven_konut = int(outs.get("breakeven_konut_adedi", 0))
-            breakeven_oran = outs.get("breakeven_konut_orani", 0)
-            toplam_konut = int(outs.get("yaklasik_konut_adedi", 0))
+            breakeven_konut = int(outs.breakeven_konut_adedi)
+            breakeven_oran = outs.breakeven_konut_orani
+            toplam_konut = int(outs.yaklasik_konut_adedi)
             
             col1.metric(
                 "Break-Even Konut",
@@ -950,7 +1394,7 @@ with tab3:
             
             col2.metric(
                 "Break-Even Orani",
-                fmt_pct(breakeven_oran),
+                fo["pct", "breakeven_konut_orani"],
                 help="Toplam konutun yuzde kaci"
             )
             
@@ -986,57 +1430,49 @@ with tab3:
             st.markdown("### 🔄 Senaryo Karsilastirmasi")
             st.caption(f"{len(st.session_state.scenarios)} senaryo kaydedildi")
             
-            # Show comparison table
-            comparison_data = {
-                "Senaryo": [],
-                "Arsa (m²)": [],
-                "Emsal": [],
-                "Maliyet ($)": [],
-                "Kar ($)": [],
-                "Karlilik": [],
-            }
-            
-            for scenario in st.session_state.scenarios:
-                comparison_data["Senaryo"].append(scenario["name"])
-                comparison_data["Arsa (m²)"].append(fmt_int(scenario["inputs"].get("arsa_alani_m2", 0)))
-                comparison_data["Emsal"].append(scenario["inputs"].get("emsal", 0))
-                comparison_data["Maliyet ($)"].append(fmt_usd(scenario["outputs"].get("toplam_proje_maliyeti_usd", 0)))
-                comparison_data["Kar ($)"].append(fmt_usd(scenario["outputs"].get("proje_kari_usd", 0)))
-                comparison_data["Karlilik"].append(fmt_pct(scenario["outputs"].get("brut_karlilik_orani", 0)))
-            
-            st.dataframe(comparison_data, use_container_width=True, hide_index=True)
+            # Show comparison table (one record per scenario, built in one pass)
+            comparison_df = pd.DataFrame(
+                [
+                    (
+                        sc.name,
+                        fmt_int(sc.inputs.get("arsa_alani_m2", 0)),
+                        sc.inputs.get("emsal", 0),
+                        fmt_usd(sc.outputs.toplam_proje_maliyeti_usd),
+                        fmt_usd(sc.outputs.proje_kari_usd),
+                        fmt_pct(sc.outputs.brut_karlilik_orani),
+                    )
+                    for sc in st.session_state.scenarios
+                ],
+                columns=["Senaryo", "Arsa (m²)", "Emsal", "Maliyet ($)", "Kar ($)", "Karlilik"],
+            )
+            st.dataframe(comparison_df, use_container_width=True, hide_index=True)
             
             # Comparison chart with native bar chart
-            import pandas as pd
-            
-            profits = [s["outputs"].get("proje_kari_usd", 0) for s in st.session_state.scenarios]
-            names = [s["name"] for s in st.session_state.scenarios]
-            
-            chart_df = pd.DataFrame({
-                "Senaryo": names,
-                "Kar (USD)": profits
-            })
+            chart_df = pd.DataFrame(
+                [(sc.name, sc.outputs.proje_kari_usd) for sc in st.session_state.scenarios],
+                columns=["Senaryo", "Kar (USD)"],
+            ).set_index("Senaryo")
             
             st.markdown("#### 📊 Kar Karsilastirmasi")
-            st.bar_chart(chart_df.set_index("Senaryo"), height=400)
+            st.bar_chart(chart_df, height=400)
             
             # Export comparison to Excel
             if st.button("📊 Karsilastirma Excel'i Indir", use_container_width=True):
                 with st.spinner("Karsilastirma hazirlaniyor..."):
-                    comp_excel_path = "senaryo_karsilastirmasi.xlsx"
+                    from excel_export import create_comparison_excel
+                    comp_excel = io.BytesIO()
                     create_comparison_excel(
-                        filepath=comp_excel_path,
+                        filepath=comp_excel,
                         scenarios=st.session_state.scenarios
                     )
-                    with open(comp_excel_path, "rb") as f:
-                        st.download_button(
-                            "⬇️ Karsilastirma Excel'i indir",
-                            data=f,
-                            file_name="senaryo_karsilastirmasi.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            use_container_width=True,
-                            key="comparison_excel_download"
-                        )
+                    st.download_button(
+                        "⬇️ Karsilastirma Excel'i indir",
+                        data=comp_excel.getvalue(),
+                        file_name="senaryo_karsilastirmasi.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        use_container_width=True,
+                        key="comparison_excel_download"
+                    )
     else:
         st.info("👈 Lutfen AI Asistan veya Hizli Hesap sekmesinden bilgileri girin")
 
@@ -1044,7 +1480,7 @@ with tab3:
 # ============================================================================
 # TAB 4: NAKİT AKIŞ ANALİZİ
 # ============================================================================
-with tab4:
+if active_tab == TAB_LABELS[3]:
     st.markdown("## 💰 Nakit Akış & Yatırım Analizi")
     st.markdown("*Proje bazlı IRR, NPV ve dönemsel nakit akış senaryoları*")
 
@@ -1088,8 +1524,6 @@ with tab4:
             with col_ctrl3:
                 custom_price = st.number_input("💲 Satış Fiyatı Override (USD/m²)", min_value=500, max_value=10000, value=int(satis_fiyat), step=100)
 
-            import pandas as pd
-
             if mode == "Senaryo Karşılaştırma":
                 with st.spinner("Senaryolar hesaplanıyor..."):
                     results = compare_scenarios(
@@ -1215,7 +1649,7 @@ with tab4:
 # ============================================================================
 # TAB 5: KARMA KULLANIM (MIXED-USE)
 # ============================================================================
-with tab5:
+if active_tab == TAB_LABELS[4]:
     st.markdown("## 🏗️ Karma Kullanım Analizi")
     st.markdown("*Konut + Ofis + Ticari karışık projeler için ayrı tip bazlı fizibilite*")
 
@@ -1230,8 +1664,6 @@ with tab5:
         mu_ok = False
 
     if mu_ok:
-        import pandas as pd
-
         st.markdown("### ⚙️ Proje Parametreleri")
         c1, c2, c3, c4 = st.columns(4)
         with c1:
@@ -1370,7 +1802,7 @@ with tab5:
 # ============================================================================
 # TAB 6: PİYASA FİYAT KARŞILAŞTIRMASI
 # ============================================================================
-with tab6:
+if active_tab == TAB_LABELS[5]:
     st.markdown("## 📍 Piyasa Fiyat Karşılaştırması")
     st.markdown("*Projenin hedef satış fiyatını bölgesel piyasa ortalamasıyla karşılaştır*")
 
@@ -1385,8 +1817,6 @@ with tab6:
         md_ok = False
 
     if md_ok:
-        import pandas as pd
-
         # ── Lokasyon Seçimi ──────────────────────────────────────────────
         st.markdown("### 📌 Lokasyon & Fiyat Girişi")
         loc1, loc2 = st.columns(2)
@@ -1,283 +1,378 @@
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.chart import PieChart, Reference, BarChart
-from typing import Dict, Any, List, Optional
+from copy import copy
+from functools import lru_cache
+from types import SimpleNamespace
+import csv
+import io
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union, BinaryIO
 from datetime import datetime
+from warnings import warn
+
+from feasibility import FeasibilityOutputs, Scenario
+
+if TYPE_CHECKING:
+    from openpyxl.chart import PieChart
+    from openpyxl.styles import Font, PatternFill
+
+_NUM_FMT_INT = '#,##0'
+_NUM_FMT_PCT = '0.0%'
+
+@lru_cache(maxsize=None)
+def _xl() -> SimpleNamespace:
+    """openpyxl classes and the shared style objects (built once, reused by every cell).
+    Imported on the first workbook build so CSV/compute-only callers never load openpyxl."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.chart import BarChart, PieChart, Reference
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+    
+    # openpyxl streams write_only sheets through lxml.etree.xmlfile when lxml is installed;
+    # without it the stdlib serializer is used and rows are buffered in memory
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        warn("lxml bulunamadi: Excel raporlari bellekte olusturulacak (pip install lxml)", RuntimeWarning, stacklevel=3)
+    
+    return SimpleNamespace(
+        Workbook=Workbook,
+        WriteOnlyCell=WriteOnlyCell,
+        BarChart=BarChart,
+        PieChart=PieChart,
+        Reference=Reference,
+        get_column_letter=get_column_letter,
+        BOLD=Font(bold=True),
+        REGULAR=Font(bold=False),
+        HEADER_FILL=PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid"),
+        TITLE_FONT=Font(size=14, bold=True, color="FFFFFF"),
+        TITLE_FONT_LARGE=Font(size=16, bold=True, color="FFFFFF"),
+        TITLE_FILL_NAVY=PatternFill(start_color="1E3A8A", end_color="1E3A8A", fill_type="solid"),
+        TITLE_FILL_BLUE=PatternFill(start_color="3B82F6", end_color="3B82F6", fill_type="solid"),
+        TITLE_FILL_GREEN=PatternFill(start_color="10B981", end_color="10B981", fill_type="solid"),
+        TITLE_FILL_AMBER=PatternFill(start_color="F59E0B", end_color="F59E0B", fill_type="solid"),
+        CENTER=Alignment(horizontal="center", vertical="center"),
+    )
+
+def _cell(ws, value, font=None, fill=None, alignment=None):
+    """Styled WriteOnlyCell for a write-only sheet"""
+    c = _xl().WriteOnlyCell(ws, value=value)
+    if font is not None:
+        c.font = font
+    if fill is not None:
+        c.fill = fill
+    if alignment is not None:
+        c.alignment = alignment
+    return c
+
+def _apply_number_format(cells: List, number_format: str):
+    """Set `number_format` on the first cell only and copy its style array to the rest.
+    The cells must not carry other styles (font/fill) since those would be overwritten."""
+    if not cells:
+        return
+    first = cells[0]
+    first.number_format = number_format
+    style = first._style
+    for c in cells[1:]:
+        c._style = copy(style)
+
+def _set_widths(ws, widths: Dict[str, float]):
+    """Set column widths by letter; on write_only sheets call before the first append"""
+    for letter, width in widths.items():
+        ws.column_dimensions[letter].width = width
+
+def _append_title(ws, text: str, fill: "PatternFill", merge: str, font: Optional["Font"] = None):
+    """Append a section title row (default font: TITLE_FONT) and merge it across `merge`"""
+    ws.append([_cell(ws, text, font=font or _xl().TITLE_FONT, fill=fill)])
+    ws.merged_cells.add(merge)
+
+def _append_table(ws, rows: List[list], int_cols=(), pct_cols=()):
+    """Append a header row plus data rows; numeric values in int/pct columns get a number format"""
+    xl = _xl()
+    body, int_cells, pct_cells = [], [], []
+    for values in rows[1:]:
+        row = []
+        for col, value in enumerate(values, start=1):
+            if isinstance(value, (int, float)) and col in int_cols:
+                value = xl.WriteOnlyCell(ws, value=value)
+                int_cells.append(value)
+            elif isinstance(value, (int, float)) and col in pct_cols:
+                value = xl.WriteOnlyCell(ws, value=value)
+                pct_cells.append(value)
+            row.append(value)
+        body.append(row)
+    # Styles must be final before a write_only row is appended
+    _apply_number_format(int_cells, _NUM_FMT_INT)
+    _apply_number_format(pct_cells, _NUM_FMT_PCT)
+    
+    ws.append([_cell(ws, v, font=xl.BOLD, fill=xl.HEADER_FILL) for v in rows[0]])
+    for row in body:
+        ws.append(row)
+
+def _cost_pie_chart(ws_cost) -> "PieChart":
+    """Cost pie (land vs construction) of the report's cost table."""
+    xl = _xl()
+    pie = xl.PieChart()
+    labels = xl.Reference(ws_cost, min_col=1, min_row=4, max_row=5)
+    data = xl.Reference(ws_cost, min_col=2, min_row=3, max_row=5)
+    pie.add_data(data, titles_from_data=True)
+    pie.set_categories(labels)
+    pie.title = "Maliyet Dagilimi"
+    return pie
+
+_INPUT_LABELS = {
+    "arsa_alani_m2": "Arsa Alani (m²)",
+    "emsal": "Emsal",
+    "satilabilir_katsayi": "Satilabilir Alan Katsayisi",
+    "otopark_tipi": "Otopark Tipi",
+    "otopark_katsayi": "Otopark Katsayisi",
+    "konut_sinifi": "Konut Sinifi",
+    "insaat_maliyet_usd_m2": "Insaat Maliyeti ($/m²)",
+    "arsa_toplam_degeri_usd": "Arsa Degeri ($)",
+    "ortalama_konut_m2": "Ortalama Konut (m²)",
+    "satis_birim_fiyat_usd_m2": "Satis Fiyati ($/m²)",
+}
+
+def _report_tables(outputs: FeasibilityOutputs) -> Dict[str, List[list]]:
+    """Header + data rows of the report tables, shared by the Excel and CSV reports"""
+    metrics = [
+        ["Metrik", "Deger", "Birim", "Detay"],
+        ["Satilabilir Alan", outputs.satilabilir_alan_m2, "m²", ""],
+        ["Toplam Insaat Alani", outputs.toplam_insaat_alani_m2, "m²", "Otopark dahil"],
+        ["Konut Adedi", int(outputs.yaklasik_konut_adedi), "adet", ""],
+        ["Toplam Maliyet (USD)", outputs.toplam_proje_maliyeti_usd, "$", ""],
+        ["Toplam Maliyet (TL)", outputs.toplam_proje_maliyeti_try, "₺", ""],
+        ["Basabas Fiyat (USD)", outputs.breakeven_usd_m2, "$/m²", ""],
+        ["Basabas Fiyat (TL)", outputs.breakeven_try_m2, "₺/m²", ""],
+    ]
+    pricing = [
+        ["Hedef", "USD/m²", "TL/m²", "Aciklama"],
+        ["Basabas", outputs.breakeven_usd_m2, outputs.breakeven_try_m2, "Maliyet karsilama"],
+        ["%10 Kar", outputs.target_10_usd_m2, outputs.target_10_try_m2, "Muhafazakar"],
+        ["%30 Kar", outputs.target_30_usd_m2, outputs.target_30_try_m2, "Dengeli"],
+        ["%50 Kar", outputs.target_50_usd_m2, outputs.target_50_try_m2, "Agresif"],
+    ]
+    tables = {"metrics": metrics, "pricing": pricing}
+    
+    # Revenue table only in revenue mode
+    if outputs.has_revenue:
+        revenue = [
+            ["Metrik", "USD", "TL", "Oran"],
+            ["Satis Fiyati", outputs.satis_birim_fiyat_usd_m2, outputs.satis_birim_fiyat_try_m2, ""],
+            ["Hasilat", outputs.proje_hasilati_usd, outputs.proje_hasilati_try, ""],
+            ["Kar", outputs.proje_kari_usd, outputs.proje_kari_try, ""],
+            ["Brut Karlilik", "", "", outputs.brut_karlilik_orani],
+        ]
+        tables["revenue"] = revenue
+    
+    # Cost breakdown
+    cost_data = [
+        ["Maliyet Kalemi", "USD", "Oran"],
+        ["Arsa Degeri", outputs.arsa_degeri_usd, ""],
+        ["Insaat Maliyeti", outputs.insaat_maliyeti_usd, ""],
+        ["TOPLAM", outputs.toplam_proje_maliyeti_usd, ""],
+    ]
+    
+    # Calculate percentages
+    total = outputs.toplam_proje_maliyeti_usd
+    if total > 0:
+        cost_data[1][2] = outputs.arsa_degeri_usd / total
+        cost_data[2][2] = outputs.insaat_maliyeti_usd / total
+        cost_data[3][2] = 1.0
+    
+    tables["cost"] = cost_data
+    return tables
 
 def create_excel_report(
-    filepath: str,
+    filepath: Union[str, BinaryIO],
     project_title: str,
     inputs: Dict[str, Any],
-    outputs: Dict[str, Any],
+    outputs: Union[FeasibilityOutputs, Dict[str, Any]],
     warnings: List[str],
     usd_try_rate: Optional[float],
     rate_source: Optional[str]
 ):
-    """Create comprehensive Excel report with charts"""
+    """Create comprehensive Excel report with charts; `filepath` may be a path or a binary stream"""
     
-    wb = Workbook()
+    if isinstance(outputs, dict):
+        outputs = FeasibilityOutputs.from_outputs(outputs)
+    tables = _report_tables(outputs)
+    
+    # Rows are streamed in order; column widths must be set before the first append
+    xl = _xl()
+    wb = xl.Workbook(write_only=True)
     
     # ============================================================================
     # SHEET 1: SUMMARY
     # ============================================================================
-    ws_summary = wb.active
-    ws_summary.title = "Ozet"
-    
-    # Header
-    ws_summary['A1'] = "KONUT PROJESI FIZIBILITE RAPORU"
-    ws_summary['A1'].font = Font(size=16, bold=True, color="FFFFFF")
-    ws_summary['A1'].fill = PatternFill(start_color="1E3A8A", end_color="1E3A8A", fill_type="solid")
-    ws_summary['A1'].alignment = Alignment(horizontal="center", vertical="center")
-    ws_summary.merge_cells('A1:D1')
+    ws_summary = wb.create_sheet("Ozet")
+    _set_widths(ws_summary, {'A': 25, 'B': 20, 'C': 20, 'D': 25})
     ws_summary.row_dimensions[1].height = 30
     
-    # Project info
-    ws_summary['A3'] = "Proje:"
-    ws_summary['B3'] = project_title
-    ws_summary['B3'].font = Font(bold=True)
-    
-    ws_summary['A4'] = "Tarih:"
-    ws_summary['B4'] = datetime.now().strftime('%d.%m.%Y')
-    
+    # Header
+    ws_summary.append([_cell(ws_summary, "KONUT PROJESI FIZIBILITE RAPORU",
+                             font=xl.TITLE_FONT_LARGE, fill=xl.TITLE_FILL_NAVY, alignment=xl.CENTER)])
+    ws_summary.merged_cells.add('A1:D1')
+    ws_summary.append([])
+    
+    # Project info (rows 3-6)
+    ws_summary.append(["Proje:", _cell(ws_summary, project_title, font=xl.BOLD)])
+    ws_summary.append(["Tarih:", datetime.now().strftime('%d.%m.%Y')])
     if usd_try_rate:
-        ws_summary['A5'] = "Kur (USD/TRY):"
-        ws_summary['B5'] = f"{usd_try_rate:.4f}"
-        ws_summary['C5'] = rate_source or ""
-    
-    ws_summary['A6'] = "Hazirlayan:"
-    ws_summary['B6'] = "Dr. Omur Tezcan / GGtech"
-    
-    # Key metrics header
-    ws_summary['A8'] = "ANA METRIKLER"
-    ws_summary['A8'].font = Font(size=14, bold=True, color="FFFFFF")
-    ws_summary['A8'].fill = PatternFill(start_color="3B82F6", end_color="3B82F6", fill_type="solid")
-    ws_summary.merge_cells('A8:D8')
-    
-    # Metrics table
-    metrics = [
-        ["Metrik", "Deger", "Birim", "Detay"],
-        ["Satilabilir Alan", outputs.get('satilabilir_alan_m2', 0), "m²", ""],
-        ["Toplam Insaat Alani", outputs.get('toplam_insaat_alani_m2', 0), "m²", "Otopark dahil"],
-        ["Konut Adedi", int(outputs.get('yaklasik_konut_adedi', 0)), "adet", ""],
-        ["Toplam Maliyet (USD)", outputs.get('toplam_proje_maliyeti_usd', 0), "$", ""],
-        ["Toplam Maliyet (TL)", outputs.get('toplam_proje_maliyeti_try', 0), "₺", ""],
-        ["Basabas Fiyat (USD)", outputs.get('breakeven_usd_m2', 0), "$/m²", ""],
-        ["Basabas Fiyat (TL)", outputs.get('breakeven_try_m2', 0), "₺/m²", ""],
-    ]
-    
-    row = 9
-    for metric in metrics:
-        for col, value in enumerate(metric, start=1):
-            cell = ws_summary.cell(row=row, column=col, value=value)
-            if row == 9:  # Header row
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
-            if col == 2 and row > 9:  # Number formatting
-                if isinstance(value, (int, float)):
-                    cell.number_format = '#,##0'
-        row += 1
-    
-    # Pricing strategy
-    ws_summary['A18'] = "SATIS FIYAT STRATEJISI"
-    ws_summary['A18'].font = Font(size=14, bold=True, color="FFFFFF")
-    ws_summary['A18'].fill = PatternFill(start_color="3B82F6", end_color="3B82F6", fill_type="solid")
-    ws_summary.merge_cells('A18:D18')
-    
-    pricing = [
-        ["Hedef", "USD/m²", "TL/m²", "Aciklama"],
-        ["Basabas", outputs.get('breakeven_usd_m2', 0), outputs.get('breakeven_try_m2', 0), "Maliyet karsilama"],
-        ["%10 Kar", outputs.get('target_10_usd_m2', 0), outputs.get('target_10_try_m2', 0), "Muhafazakar"],
-        ["%30 Kar", outputs.get('target_30_usd_m2', 0), outputs.get('target_30_try_m2', 0), "Dengeli"],
-        ["%50 Kar", outputs.get('target_50_usd_m2', 0), outputs.get('target_50_try_m2', 0), "Agresif"],
-    ]
-    
-    row = 19
-    for price in pricing:
-        for col, value in enumerate(price, start=1):
-            cell = ws_summary.cell(row=row, column=col, value=value)
-            if row == 19:
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
-            if col in [2, 3] and row > 19:
-                if isinstance(value, (int, float)):
-                    cell.number_format = '#,##0'
-        row += 1
-    
-    # Revenue section (if sales price exists)
-    if outputs.get("satis_birim_fiyat_usd_m2"):
-        ws_summary['A25'] = "GELIR & KARLILIK"
-        ws_summary['A25'].font = Font(size=14, bold=True, color="FFFFFF")
-        ws_summary['A25'].fill = PatternFill(start_color="10B981", end_color="10B981", fill_type="solid")
-        ws_summary.merge_cells('A25:D25')
-        
-        revenue = [
-            ["Metrik", "USD", "TL", "Oran"],
-            ["Satis Fiyati", outputs.get('satis_birim_fiyat_usd_m2', 0), outputs.get('satis_birim_fiyat_try_m2', 0), ""],
-            ["Hasilat", outputs.get('proje_hasilati_usd', 0), outputs.get('proje_hasilati_try', 0), ""],
-            ["Kar", outputs.get('proje_kari_usd', 0), outputs.get('proje_kari_try', 0), ""],
-            ["Brut Karlilik", "", "", outputs.get('brut_karlilik_orani', 0)],
-        ]
-        
-        row = 26
-        for rev in revenue:
-            for col, value in enumerate(rev, start=1):
-                cell = ws_summary.cell(row=row, column=col, value=value)
-                if row == 26:
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
-                if col in [2, 3] and row > 26:
-                    if isinstance(value, (int, float)):
-                        cell.number_format = '#,##0'
-                if col == 4 and row == 30:  # Profit margin
-                    if isinstance(value, (int, float)):
-                        cell.number_format = '0.0%'
-            row += 1
-    
-    # Column widths
-    ws_summary.column_dimensions['A'].width = 25
-    ws_summary.column_dimensions['B'].width = 20
-    ws_summary.column_dimensions['C'].width = 20
-    ws_summary.column_dimensions['D'].width = 25
+        ws_summary.append(["Kur (USD/TRY):", f"{usd_try_rate:.4f}", rate_source or ""])
+    else:
+        ws_summary.append([])
+    ws_summary.append(["Hazirlayan:", "Dr. Omur Tezcan / GGtech"])
+    ws_summary.append([])
+    
+    # Key metrics (rows 8-16)
+    _append_title(ws_summary, "ANA METRIKLER", xl.TITLE_FILL_BLUE, 'A8:D8')
+    _append_table(ws_summary, tables["metrics"], int_cols=(2,))
+    ws_summary.append([])
+    
+    # Pricing strategy (rows 18-23)
+    _append_title(ws_summary, "SATIS FIYAT STRATEJISI", xl.TITLE_FILL_BLUE, 'A18:D18')
+    _append_table(ws_summary, tables["pricing"], int_cols=(2, 3))
+    
+    # Revenue section (rows 25-30, only in revenue mode)
+    if "revenue" in tables:
+        ws_summary.append([])
+        _append_title(ws_summary, "GELIR & KARLILIK", xl.TITLE_FILL_GREEN, 'A25:D25')
+        _append_table(ws_summary, tables["revenue"], int_cols=(2, 3), pct_cols=(4,))
     
     # ============================================================================
     # SHEET 2: DETAILED INPUTS
     # ============================================================================
     ws_inputs = wb.create_sheet("Girdiler")
+    _set_widths(ws_inputs, {'A': 30, 'B': 20, 'C': 30})
     
-    ws_inputs['A1'] = "PROJE GIRDI PARAMETRELERI"
-    ws_inputs['A1'].font = Font(size=14, bold=True, color="FFFFFF")
-    ws_inputs['A1'].fill = PatternFill(start_color="1E3A8A", end_color="1E3A8A", fill_type="solid")
-    ws_inputs.merge_cells('A1:C1')
-    
-    input_labels = {
-        "arsa_alani_m2": "Arsa Alani (m²)",
-        "emsal": "Emsal",
-        "satilabilir_katsayi": "Satilabilir Alan Katsayisi",
-        "otopark_tipi": "Otopark Tipi",
-        "otopark_katsayi": "Otopark Katsayisi",
-        "konut_sinifi": "Konut Sinifi",
-        "insaat_maliyet_usd_m2": "Insaat Maliyeti ($/m²)",
-        "arsa_toplam_degeri_usd": "Arsa Degeri ($)",
-        "ortalama_konut_m2": "Ortalama Konut (m²)",
-        "satis_birim_fiyat_usd_m2": "Satis Fiyati ($/m²)",
-    }
-    
-    row = 3
-    ws_inputs.cell(row=row, column=1, value="Parametre").font = Font(bold=True)
-    ws_inputs.cell(row=row, column=2, value="Deger").font = Font(bold=True)
-    ws_inputs.cell(row=row, column=3, value="Not").font = Font(bold=True)
-    row += 1
-    
-    for key, label in input_labels.items():
-        if key in inputs:
-            ws_inputs.cell(row=row, column=1, value=label)
-            ws_inputs.cell(row=row, column=2, value=inputs[key])
-            row += 1
+    _append_title(ws_inputs, "PROJE GIRDI PARAMETRELERI", xl.TITLE_FILL_NAVY, 'A1:C1')
+    ws_inputs.append([])
     
-    ws_inputs.column_dimensions['A'].width = 30
-    ws_inputs.column_dimensions['B'].width = 20
-    ws_inputs.column_dimensions['C'].width = 30
+    ws_inputs.append([_cell(ws_inputs, v, font=xl.BOLD) for v in ("Parametre", "Deger", "Not")])
+    for key, label in _INPUT_LABELS.items():
+        if key in inputs:
+            ws_inputs.append([label, inputs[key]])
     
     # ============================================================================
     # SHEET 3: COST BREAKDOWN with PIE CHART
     # ============================================================================
     ws_cost = wb.create_sheet("Maliyet Dagilimi")
+    _set_widths(ws_cost, {'A': 25, 'B': 20, 'C': 15})
     
-    ws_cost['A1'] = "MALIYET DAGILIMI ANALIZI"
-    ws_cost['A1'].font = Font(size=14, bold=True, color="FFFFFF")
-    ws_cost['A1'].fill = PatternFill(start_color="1E3A8A", end_color="1E3A8A", fill_type="solid")
-    ws_cost.merge_cells('A1:C1')
-    
-    # Cost breakdown data
-    cost_data = [
-        ["Maliyet Kalemi", "USD", "Oran"],
-        ["Arsa Degeri", outputs.get('arsa_degeri_usd', 0), ""],
-        ["Insaat Maliyeti", outputs.get('insaat_maliyeti_usd', 0), ""],
-        ["TOPLAM", outputs.get('toplam_proje_maliyeti_usd', 0), ""],
-    ]
-    
-    # Calculate percentages
-    total = outputs.get('toplam_proje_maliyeti_usd', 1)
-    if total > 0:
-        cost_data[1][2] = outputs.get('arsa_degeri_usd', 0) / total
-        cost_data[2][2] = outputs.get('insaat_maliyeti_usd', 0) / total
-        cost_data[3][2] = 1.0
+    _append_title(ws_cost, "MALIYET DAGILIMI ANALIZI", xl.TITLE_FILL_NAVY, 'A1:C1')
+    ws_cost.append([])
     
-    row = 3
-    for cost in cost_data:
-        for col, value in enumerate(cost, start=1):
-            cell = ws_cost.cell(row=row, column=col, value=value)
-            if row == 3:
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
-            if col == 2 and isinstance(value, (int, float)):
-                cell.number_format = '#,##0'
-            if col == 3 and isinstance(value, (int, float)):
-                cell.number_format = '0.0%'
-        row += 1
+    # Cost breakdown data (rows 3-6)
+    _append_table(ws_cost, tables["cost"], int_cols=(2,), pct_cols=(3,))
     
     # Add pie chart
-    pie = PieChart()
-    labels = Reference(ws_cost, min_col=1, min_row=4, max_row=5)
-    data = Reference(ws_cost, min_col=2, min_row=3, max_row=5)
-    pie.add_data(data, titles_from_data=True)
-    pie.set_categories(labels)
-    pie.title = "Maliyet Dagilimi"
+    pie = _cost_pie_chart(ws_cost)
     ws_cost.add_chart(pie, "E3")
     
-    ws_cost.column_dimensions['A'].width = 25
-    ws_cost.column_dimensions['B'].width = 20
-    ws_cost.column_dimensions['C'].width = 15
-    
     # ============================================================================
     # SHEET 4: WARNINGS
     # ============================================================================
     if warnings:
         ws_warn = wb.create_sheet("Uyarilar")
+        _set_widths(ws_warn, {'A': 5, 'B': 80})
         
-        ws_warn['A1'] = "UYARILAR VE NOTLAR"
-        ws_warn['A1'].font = Font(size=14, bold=True, color="FFFFFF")
-        ws_warn['A1'].fill = PatternFill(start_color="F59E0B", end_color="F59E0B", fill_type="solid")
-        ws_warn.merge_cells('A1:B1')
+        _append_title(ws_warn, "UYARILAR VE NOTLAR", xl.TITLE_FILL_AMBER, 'A1:B1')
+        ws_warn.append([])
         
-        row = 3
         for i, warning in enumerate(warnings, start=1):
-            ws_warn.cell(row=row, column=1, value=i)
-            ws_warn.cell(row=row, column=2, value=warning)
-            row += 1
-        
-        ws_warn.column_dimensions['A'].width = 5
-        ws_warn.column_dimensions['B'].width = 80
+            ws_warn.append([i, warning])
     
     # Save
     wb.save(filepath)
 
+def create_csv_report(
+    filepath: Union[str, BinaryIO],
+    project_title: str,
+    inputs: Dict[str, Any],
+    outputs: Union[FeasibilityOutputs, Dict[str, Any]],
+    warnings: List[str],
+    usd_try_rate: Optional[float],
+    rate_source: Optional[str]
+):
+    """Same tables as create_excel_report as a ';'-separated CSV (no styling/charts, no openpyxl)"""
+    
+    if isinstance(outputs, dict):
+        outputs = FeasibilityOutputs.from_outputs(outputs)
+    tables = _report_tables(outputs)
+    
+    rows: List[list] = [
+        ["KONUT PROJESI FIZIBILITE RAPORU"],
+        ["Proje:", project_title],
+        ["Tarih:", datetime.now().strftime('%d.%m.%Y')],
+    ]
+    if usd_try_rate:
+        rows.append(["Kur (USD/TRY):", f"{usd_try_rate:.4f}", rate_source or ""])
+    rows.append(["Hazirlayan:", "Dr. Omur Tezcan / GGtech"])
+    
+    sections = [
+        ("ANA METRIKLER", tables["metrics"]),
+        ("SATIS FIYAT STRATEJISI", tables["pricing"]),
+    ]
+    if "revenue" in tables:
+        sections.append(("GELIR & KARLILIK", tables["revenue"]))
+    sections.append((
+        "PROJE GIRDI PARAMETRELERI",
+        [["Parametre", "Deger"]] + [[label, inputs[key]] for key, label in _INPUT_LABELS.items() if key in inputs],
+    ))
+    sections.append(("MALIYET DAGILIMI ANALIZI", tables["cost"]))
+    if warnings:
+        sections.append(("UYARILAR VE NOTLAR", [[i, w] for i, w in enumerate(warnings, start=1)]))
+    
+    for title, table in sections:
+        rows.append([])
+        rows.append([title])
+        rows.extend(table)
+    
+    # utf-8-sig so Excel detects the encoding of ², ₺ etc.
+    if isinstance(filepath, str):
+        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
+            csv.writer(f, delimiter=";").writerows(rows)
+    else:
+        f = io.TextIOWrapper(filepath, encoding="utf-8-sig", newline="")
+        try:
+            csv.writer(f, delimiter=";").writerows(rows)
+        finally:
+            f.flush()
+            f.detach()
+
 def create_comparison_excel(
-    filepath: str,
-    scenarios: List[Dict[str, Any]]
+    filepath: Union[str, BinaryIO],
+    scenarios: List[Union[Scenario, Dict[str, Any]]]
 ):
-    """Create Excel with multiple scenario comparison"""
+    """Create Excel with multiple scenario comparison; `filepath` may be a path or a binary stream.
+    Scenarios may also be plain dicts with name/inputs/outputs keys (the older API)."""
     
-    wb = Workbook()
+    scenarios = [
+        Scenario(s.get("name", ""), s.get("inputs") or {}, s.get("outputs") or {}, s.get("timestamp", ""))
+        if isinstance(s, dict) else s
+        for s in scenarios
+    ]
+    xl = _xl()
+    wb = xl.Workbook()
     ws = wb.active
     ws.title = "Senaryo Karsilastirmasi"
+    cols = [xl.get_column_letter(i + 2) for i in range(len(scenarios))]  # B, C, D...
+    scenario_maps = [
+        (scenario.name or f'Senaryo {i+1}', scenario.inputs or {}, scenario.outputs)
+        for i, scenario in enumerate(scenarios)
+    ]
     
     # Header
     ws['A1'] = "SENARYO KARSILASTIRMA ANALIZI"
-    ws['A1'].font = Font(size=16, bold=True, color="FFFFFF")
-    ws['A1'].fill = PatternFill(start_color="1E3A8A", end_color="1E3A8A", fill_type="solid")
-    ws.merge_cells(f'A1:{chr(65 + len(scenarios))}1')
-    
-    # Column headers
-    ws['A3'] = "Metrik"
-    ws['A3'].font = Font(bold=True)
-    ws['A3'].fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
+    ws['A1'].font = xl.TITLE_FONT_LARGE
+    ws['A1'].fill = xl.TITLE_FILL_NAVY
+    ws.merge_cells(f'A1:{cols[-1] if cols else "A"}1')
     
-    for i, scenario in enumerate(scenarios):
-        col = chr(66 + i)  # B, C, D...
-        ws[f'{col}3'] = scenario.get('name', f'Senaryo {i+1}')
-        ws[f'{col}3'].font = Font(bold=True)
-        ws[f'{col}3'].fill = PatternFill(start_color="E5E7EB", end_color="E5E7EB", fill_type="solid")
+    # Column headers (row 3)
+    ws.append([])
+    ws.append(["Metrik"] + [name for name, _, _ in scenario_maps])
+    for cell in ws[3]:
+        cell.font = xl.BOLD
+        cell.fill = xl.HEADER_FILL
     
     # Metrics to compare
     comparison_metrics = [
@@ -295,33 +390,31 @@ def create_comparison_excel(
     ]
     
     row = 4
+    int_cells, pct_cells = [], []
     for label, key, source in comparison_metrics:
-        ws[f'A{row}'] = label
+        if source:
+            values = [(inp if source == "input" else out).get(key, "") for _, inp, out in scenario_maps]
+        else:
+            values = [""] * len(scenario_maps)
+        ws.append([label] + values)
+        
+        cells = ws[row]
         if label:  # Not empty row
-            ws[f'A{row}'].font = Font(bold=True if not source else False)
+            cells[0].font = xl.BOLD if not source else xl.REGULAR
         
-        for i, scenario in enumerate(scenarios):
-            col = chr(66 + i)
-            if source == "input":
-                value = scenario.get('inputs', {}).get(key, "")
-            elif source == "output":
-                value = scenario.get('outputs', {}).get(key, "")
-            else:
-                value = ""
-            
-            cell = ws[f'{col}{row}']
-            cell.value = value
-            
-            # Formatting
+        # Formatting
+        for cell, value in zip(cells[1:], values):
             if key == "brut_karlilik_orani" and isinstance(value, (int, float)):
-                cell.number_format = '0.0%'
+                pct_cells.append(cell)
             elif isinstance(value, (int, float)) and value > 100:
-                cell.number_format = '#,##0'
+                int_cells.append(cell)
         
         row += 1
+    _apply_number_format(int_cells, _NUM_FMT_INT)
+    _apply_number_format(pct_cells, _NUM_FMT_PCT)
     
     # Add comparison chart
-    chart = BarChart()
+    chart = xl.BarChart()
     chart.type = "col"
     chart.title = "Kar Karsilastirmasi"
     chart.x_axis.title = "Senaryo"
@@ -335,16 +428,13 @@ def create_comparison_excel(
             break
     
     if profit_row:
-        data = Reference(ws, min_col=2, max_col=1+len(scenarios), min_row=profit_row, max_row=profit_row)
-        cats = Reference(ws, min_col=2, max_col=1+len(scenarios), min_row=3, max_row=3)
+        data = xl.Reference(ws, min_col=2, max_col=1+len(scenarios), min_row=profit_row, max_row=profit_row)
+        cats = xl.Reference(ws, min_col=2, max_col=1+len(scenarios), min_row=3, max_row=3)
         chart.add_data(data, titles_from_data=False)
         chart.set_categories(cats)
         ws.add_chart(chart, f"A{row+2}")
     
     # Column widths
-    ws.column_dimensions['A'].width = 30
-    for i in range(len(scenarios)):
-        col = chr(66 + i)
-        ws.column_dimensions[col].width = 20
+    _set_widths(ws, {'A': 30, **dict.fromkeys(cols, 20)})
     
     wb.save(filepath)
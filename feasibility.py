@@ -1,7 +1,21 @@
 from __future__ import annotations
-from typing import Literal, Dict, Any, List, Tuple, Optional
+from typing import Literal, Dict, Any, List, NamedTuple, Tuple, Optional
 import math
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 OtoparkTipi = Literal["ACIK", "KAPALI"]
 KonutSinifi = Literal["ALT", "ORTA", "YUKSEK"]
 
@@ -20,46 +34,105 @@ DAIRE_TIPLERI = {
     "4+1": 150,
 }
 
-def compute_outputs(
-    inputs: Dict[str, Any],
-    usd_try_rate: Optional[float] = None,
-) -> Tuple[Dict[str, Any], List[str]]:
+class FeasibilityOutputs(NamedTuple):
     """
-    2 mod:
-    - Maliyet modu: satis fiyati girilmeden calisir (basabas + hedef fiyatlar uretir)
-    - Gelir modu: satis fiyati varsa hasilat/kar/karlilik hesaplar
+    compute_outputs sonucu (alan erisimli).
+    `get` ve `to_dict`, sozluk bekleyen kodlar icindir.
     """
-
-    # Zorunlu alanlar (satis fiyati artik zorunlu degil)
-    required = [
-        "arsa_alani_m2",
-        "emsal",
-        "otopark_tipi",
-        "konut_sinifi",
-        "arsa_toplam_degeri_usd",
-    ]
-    for k in required:
-        if k not in inputs or inputs[k] in [None, ""]:
-            raise ValueError(f"Eksik alan: {k}")
-
-    # --- Inputs ---
-    arsa = float(inputs["arsa_alani_m2"])
-    emsal = float(inputs["emsal"])
-
-    satilabilir_katsayi = float(inputs.get("satilabilir_katsayi", DEFAULTS["satilabilir_katsayi"]))
-
-    otopark_tipi: OtoparkTipi = inputs["otopark_tipi"]
-    otopark_katsayi = float(inputs.get("otopark_katsayi", DEFAULTS["otopark_katsayi"][otopark_tipi]))
-
-    konut_sinifi: KonutSinifi = inputs["konut_sinifi"]
-    insaat_maliyet_birim = float(inputs.get("insaat_maliyet_usd_m2", DEFAULTS["insaat_maliyet_usd_m2"][konut_sinifi]))
-
-    arsa_degeri = float(inputs["arsa_toplam_degeri_usd"])
-    ort_konut = float(inputs.get("ortalama_konut_m2", DEFAULTS["ortalama_konut_m2"]))
-
-    satis_fiyat_raw = inputs.get("satis_birim_fiyat_usd_m2", None)
-    satis_fiyat = float(satis_fiyat_raw) if satis_fiyat_raw not in [None, ""] else None
-
+    # Areas
+    emsal_insaat_alani_m2: float
+    satilabilir_alan_m2: float
+    toplam_insaat_alani_m2: float
+
+    # Costs
+    insaat_maliyeti_usd: float
+    arsa_degeri_usd: float
+    toplam_proje_maliyeti_usd: float
+    insaat_maliyeti_try: Optional[float]
+    arsa_degeri_try: Optional[float]
+    toplam_proje_maliyeti_try: Optional[float]
+
+    # Units
+    yaklasik_konut_adedi: int
+    kalan_satilabilir_alan_m2: float
+
+    # Breakeven + targets
+    breakeven_usd_m2: float
+    target_10_usd_m2: float
+    target_30_usd_m2: float
+    target_50_usd_m2: float
+    breakeven_try_m2: Optional[float]
+    target_10_try_m2: Optional[float]
+    target_30_try_m2: Optional[float]
+    target_50_try_m2: Optional[float]
+
+    # Revenue/profit (None unless a sales price is given)
+    satis_birim_fiyat_usd_m2: Optional[float] = None
+    satis_birim_fiyat_try_m2: Optional[float] = None
+    proje_hasilati_usd: Optional[float] = None
+    proje_hasilati_try: Optional[float] = None
+    proje_kari_usd: Optional[float] = None
+    proje_kari_try: Optional[float] = None
+    brut_karlilik_orani: Optional[float] = None
+    breakeven_konut_adedi: Optional[int] = None
+    breakeven_konut_orani: Optional[float] = None
+    daire_fiyatlari: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # Gosterim oranlari (yuzde) ve gelir modu bayragi, from_outputs tarafindan bir kez hesaplanir
+    arsa_pct: float = 0.0
+    insaat_pct: float = 0.0
+    profit_margin_pct: Optional[float] = None
+    has_revenue: bool = False
+
+    @classmethod
+    def from_outputs(cls, outputs: Dict[str, Any]) -> "FeasibilityOutputs":
+        total = outputs["toplam_proje_maliyeti_usd"]
+        brut = outputs["brut_karlilik_orani"]
+        return cls(
+            **outputs,
+            arsa_pct=(outputs["arsa_degeri_usd"] / total * 100) if total > 0 else 0.0,
+            insaat_pct=(outputs["insaat_maliyeti_usd"] / total * 100) if total > 0 else 0.0,
+            profit_margin_pct=brut * 100 if brut is not None else None,
+            has_revenue=brut is not None,
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        dict.get gibi alan okuma; yalnizca alan adlarina bakar (count/index/_asdict gibi
+        tuple uyeleri icin default doner). Dikkat: sozluk gibi degil, outputs["k"] TypeError
+        verir ve "k" in outputs anahtarlari degil degerleri kontrol eder.
+        """
+        return getattr(self, key) if key in self._fields else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON/rapor katmanlari icin sozluk (gelir yoksa daire_fiyatlari anahtari yok)."""
+        d = self._asdict()
+        for k in _DERIVED_OUTPUT_FIELDS:
+            del d[k]
+        if d["daire_fiyatlari"] is None:
+            del d["daire_fiyatlari"]
+        return d
+
+_DERIVED_OUTPUT_FIELDS = ("arsa_pct", "insaat_pct", "profit_margin_pct", "has_revenue")
+
+class Scenario(NamedTuple):
+    """Karsilastirma icin kaydedilmis senaryo."""
+    name: str
+    inputs: Dict[str, Any]
+    outputs: FeasibilityOutputs
+    timestamp: str
+
+@njit(cache=True)
+def _cost_kernel(
+    arsa: float,
+    emsal: float,
+    satilabilir_katsayi: float,
+    otopark_katsayi: float,
+    insaat_maliyet_birim: float,
+    arsa_degeri: float,
+    ort_konut: float,
+):
+    """Scalar area/cost/target-price math of compute_outputs (JIT-compiled when numba is present)."""
     # --- Core areas ---
     emsal_insaat = arsa * emsal
     satilabilir = emsal_insaat * satilabilir_katsayi
@@ -75,24 +148,122 @@ def compute_outputs(
     kalan_alan = satilabilir - (konut_adedi * ort_konut) if konut_adedi > 0 else satilabilir
 
     # --- Breakeven and target sales prices (USD/m²) ---
-    breakeven_usd_m2 = (toplam_maliyet / satilabilir) if satilabilir > 0 else 0.0
+    # margin is gross profitability target: kar/maliyet
+    if satilabilir > 0:
+        breakeven_usd_m2 = toplam_maliyet / satilabilir
+        target_10 = toplam_maliyet * 1.10 / satilabilir
+        target_30 = toplam_maliyet * 1.30 / satilabilir
+        target_50 = toplam_maliyet * 1.50 / satilabilir
+    else:
+        breakeven_usd_m2 = target_10 = target_30 = target_50 = 0.0
+
+    return (
+        emsal_insaat, satilabilir, insaat_alani,
+        insaat_maliyeti, toplam_maliyet,
+        konut_adedi, kalan_alan,
+        breakeven_usd_m2, target_10, target_30, target_50,
+    )
+
+@njit(cache=True)
+def _revenue_kernel(
+    satilabilir: float,
+    toplam_maliyet: float,
+    satis_fiyat: float,
+    konut_adedi: int,
+    ort_konut: float,
+):
+    """Revenue/profit/break-even math for a positive sales price."""
+    hasilat = satilabilir * satis_fiyat
+    kar = hasilat - toplam_maliyet
+    brut_karlilik = (kar / toplam_maliyet) if toplam_maliyet > 0 else 0.0
+
+    # Break-even: Kaç konut satılmalı?
+    if konut_adedi > 0 and ort_konut > 0:
+        breakeven_alan = toplam_maliyet / satis_fiyat
+        breakeven_konut = math.ceil(breakeven_alan / ort_konut)
+        breakeven_oran = breakeven_konut / konut_adedi
+    else:
+        breakeven_konut = 0
+        breakeven_oran = 0.0
+
+    return hasilat, kar, brut_karlilik, breakeven_konut, breakeven_oran
+
+# Zorunlu alanlar (satis fiyati artik zorunlu degil)
+_REQUIRED = (
+    "arsa_alani_m2",
+    "emsal",
+    "otopark_tipi",
+    "konut_sinifi",
+    "arsa_toplam_degeri_usd",
+)
+_EMPTY = frozenset((None, ""))
+
+class _CoercedInputs(NamedTuple):
+    """compute_outputs'un kullandigi sayisal girdiler (varsayilanlar uygulanmis)."""
+    arsa: float
+    emsal: float
+    sat_kat: float
+    otopark_kat: float
+    unit_cost: float
+    arsa_degeri: float
+    ort_konut: float
+    satis_fiyat: Optional[float]
+
+def _f(x: Any, _t: type = float) -> float:
+    """float(x), ama x zaten float ise (number_input degerleri) donusumu atlar."""
+    return x if x.__class__ is _t else _t(x)
+
+def _coerce_inputs(inputs: Dict[str, Any]) -> _CoercedInputs:
+    """Zorunlu alanlari dogrular, varsayilanlari uygular ve sayilari float'a cevirir."""
+    missing = [k for k in _REQUIRED if inputs.get(k) in _EMPTY]
+    if missing:
+        raise ValueError(f"Eksik alan: {missing[0]}")
+
+    otopark_tipi: OtoparkTipi = inputs["otopark_tipi"]
+    konut_sinifi: KonutSinifi = inputs["konut_sinifi"]
+    satis_fiyat_raw = inputs.get("satis_birim_fiyat_usd_m2", None)
 
-    def target_price_usd_m2(margin: float) -> float:
-        # margin is gross profitability target: kar/maliyet
-        required_revenue = toplam_maliyet * (1.0 + margin)
-        return (required_revenue / satilabilir) if satilabilir > 0 else 0.0
+    return _CoercedInputs(
+        arsa=_f(inputs["arsa_alani_m2"]),
+        emsal=_f(inputs["emsal"]),
+        sat_kat=_f(inputs.get("satilabilir_katsayi", DEFAULTS["satilabilir_katsayi"])),
+        otopark_kat=_f(inputs.get("otopark_katsayi", DEFAULTS["otopark_katsayi"][otopark_tipi])),
+        unit_cost=_f(inputs.get("insaat_maliyet_usd_m2", DEFAULTS["insaat_maliyet_usd_m2"][konut_sinifi])),
+        arsa_degeri=_f(inputs["arsa_toplam_degeri_usd"]),
+        ort_konut=_f(inputs.get("ortalama_konut_m2", DEFAULTS["ortalama_konut_m2"])),
+        satis_fiyat=_f(satis_fiyat_raw) if satis_fiyat_raw not in _EMPTY else None,
+    )
 
-    target_10 = target_price_usd_m2(0.10)
-    target_30 = target_price_usd_m2(0.30)
-    target_50 = target_price_usd_m2(0.50)
+def compute_outputs(
+    inputs: Dict[str, Any],
+    usd_try_rate: Optional[float] = None,
+) -> Tuple[FeasibilityOutputs, List[str]]:
+    """
+    2 mod:
+    - Maliyet modu: satis fiyati girilmeden calisir (basabas + hedef fiyatlar uretir)
+    - Gelir modu: satis fiyati varsa hasilat/kar/karlilik hesaplar
+    """
+    return _compute_from_coerced(_coerce_inputs(inputs), usd_try_rate)
 
-    # --- USD->TRY conversions (if rate provided) ---
-    def to_try(x_usd: Optional[float]) -> Optional[float]:
-        if x_usd is None:
-            return None
-        if usd_try_rate is None:
-            return None
-        return x_usd * float(usd_try_rate)
+def _compute_from_coerced(
+    nums: _CoercedInputs,
+    usd_try_rate: Optional[float] = None,
+) -> Tuple[FeasibilityOutputs, List[str]]:
+    """compute_outputs'un aritmetik kismi; girdiler _coerce_inputs ile hazirlanmis olmali."""
+    (
+        arsa, emsal, satilabilir_katsayi, otopark_katsayi,
+        insaat_maliyet_birim, arsa_degeri, ort_konut, satis_fiyat,
+    ) = nums
+
+    (
+        emsal_insaat, satilabilir, insaat_alani,
+        insaat_maliyeti, toplam_maliyet,
+        konut_adedi, kalan_alan,
+        breakeven_usd_m2, target_10, target_30, target_50,
+    ) = _cost_kernel(arsa, emsal, satilabilir_katsayi, otopark_katsayi, insaat_maliyet_birim, arsa_degeri, ort_konut)
+
+    # --- USD->TRY conversion factor (TL fields are filled below only if a rate is given) ---
+    rate = _f(usd_try_rate) if usd_try_rate is not None else None
 
     outputs: Dict[str, Any] = {
         # Areas
@@ -105,9 +276,9 @@ def compute_outputs(
         "arsa_degeri_usd": arsa_degeri,
         "toplam_proje_maliyeti_usd": toplam_maliyet,
 
-        "insaat_maliyeti_try": to_try(insaat_maliyeti),
-        "arsa_degeri_try": to_try(arsa_degeri),
-        "toplam_proje_maliyeti_try": to_try(toplam_maliyet),
+        "insaat_maliyeti_try": None,
+        "arsa_degeri_try": None,
+        "toplam_proje_maliyeti_try": None,
 
         # Units
         "yaklasik_konut_adedi": konut_adedi,
@@ -119,14 +290,14 @@ def compute_outputs(
         "target_30_usd_m2": target_30,
         "target_50_usd_m2": target_50,
 
-        "breakeven_try_m2": to_try(breakeven_usd_m2),
-        "target_10_try_m2": to_try(target_10),
-        "target_30_try_m2": to_try(target_30),
-        "target_50_try_m2": to_try(target_50),
+        "breakeven_try_m2": None,
+        "target_10_try_m2": None,
+        "target_30_try_m2": None,
+        "target_50_try_m2": None,
 
         # Revenue/profit placeholders (filled only if sales price provided)
         "satis_birim_fiyat_usd_m2": satis_fiyat,
-        "satis_birim_fiyat_try_m2": to_try(satis_fiyat) if satis_fiyat is not None else None,
+        "satis_birim_fiyat_try_m2": None,
 
         "proje_hasilati_usd": None,
         "proje_hasilati_try": None,
@@ -139,26 +310,29 @@ def compute_outputs(
         "breakeven_konut_orani": None,
     }
 
+    if rate is not None:
+        outputs.update({
+            "insaat_maliyeti_try": insaat_maliyeti * rate,
+            "arsa_degeri_try": arsa_degeri * rate,
+            "toplam_proje_maliyeti_try": toplam_maliyet * rate,
+            "breakeven_try_m2": breakeven_usd_m2 * rate,
+            "target_10_try_m2": target_10 * rate,
+            "target_30_try_m2": target_30 * rate,
+            "target_50_try_m2": target_50 * rate,
+            "satis_birim_fiyat_try_m2": satis_fiyat * rate if satis_fiyat is not None else None,
+        })
+
     # --- Revenue mode (only if valid sales price) ---
     if satis_fiyat is not None and satis_fiyat > 0:
-        hasilat = satilabilir * satis_fiyat
-        kar = hasilat - toplam_maliyet
-        brut_karlilik = (kar / toplam_maliyet) if toplam_maliyet > 0 else 0.0
-        
-        # Break-even: Kaç konut satılmalı?
-        if konut_adedi > 0 and ort_konut > 0:
-            breakeven_alan = toplam_maliyet / satis_fiyat if satis_fiyat > 0 else 0
-            breakeven_konut = math.ceil(breakeven_alan / ort_konut) if ort_konut > 0 else 0
-            breakeven_oran = (breakeven_konut / konut_adedi) if konut_adedi > 0 else 0
-        else:
-            breakeven_konut = 0
-            breakeven_oran = 0
+        hasilat, kar, brut_karlilik, breakeven_konut, breakeven_oran = _revenue_kernel(
+            satilabilir, toplam_maliyet, satis_fiyat, konut_adedi, ort_konut
+        )
 
         outputs.update({
             "proje_hasilati_usd": hasilat,
-            "proje_hasilati_try": to_try(hasilat),
+            "proje_hasilati_try": hasilat * rate if rate is not None else None,
             "proje_kari_usd": kar,
-            "proje_kari_try": to_try(kar),
+            "proje_kari_try": kar * rate if rate is not None else None,
             "brut_karlilik_orani": brut_karlilik,
             "breakeven_konut_adedi": breakeven_konut,
             "breakeven_konut_orani": breakeven_oran,
@@ -170,7 +344,7 @@ def compute_outputs(
             daire_fiyatlari[tip] = {
                 "m2": m2,
                 "fiyat_usd": m2 * satis_fiyat,
-                "fiyat_try": to_try(m2 * satis_fiyat) if usd_try_rate else None,
+                "fiyat_try": m2 * satis_fiyat * rate if rate else None,
             }
         outputs["daire_fiyatlari"] = daire_fiyatlari
 
@@ -203,7 +377,7 @@ def compute_outputs(
 
     # Profitability flags only if revenue mode
     if outputs["brut_karlilik_orani"] is not None:
-        gm = float(outputs["brut_karlilik_orani"])
+        gm = _f(outputs["brut_karlilik_orani"])
         if gm < 0:
             warnings.append("🚩 Proje zararda gorunuyor (brut karlilik negatif).")
         elif gm < 0.10:
@@ -211,7 +385,54 @@ def compute_outputs(
         elif gm < 0.20:
             warnings.append("ℹ️ Brut karlilik %10–%20 araliginda (orta).")
 
-    return outputs, warnings
+    return FeasibilityOutputs.from_outputs(outputs), warnings
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _sensitivity_kernel(
+    satilabilir: float,
+    insaat_alani: float,
+    arsa_degeri: float,
+    unit_cost: float,
+    satis_fiyat: float,
+    sales_mults: np.ndarray,
+    cost_mults: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Kar ve brut karlilik grid'i (satir: maliyet carpani, sutun: satis carpani)."""
+    n_cost = cost_mults.shape[0]
+    n_sales = sales_mults.shape[0]
+    profit = np.empty((n_cost, n_sales))
+    margin = np.empty((n_cost, n_sales))
+    for i in prange(n_cost):
+        maliyet = insaat_alani * (unit_cost * cost_mults[i]) + arsa_degeri
+        for j in range(n_sales):
+            kar = satilabilir * (satis_fiyat * sales_mults[j]) - maliyet
+            profit[i, j] = kar
+            margin[i, j] = kar / maliyet if maliyet > 0 else 0.0
+    return profit, margin
+
+
+def _sensitivity_broadcast(
+    satilabilir: float,
+    insaat_alani: float,
+    arsa_degeri: float,
+    unit_cost: float,
+    satis_fiyat: float,
+    sales_mults: np.ndarray,
+    cost_mults: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """_sensitivity_kernel ile ayni grid; numba yokken tek seferde NumPy broadcasting ile."""
+    maliyet = insaat_alani * (unit_cost * cost_mults[:, None]) + arsa_degeri
+    kar = satilabilir * (satis_fiyat * sales_mults[None, :]) - maliyet
+    margin = np.divide(kar, maliyet, out=np.zeros_like(kar), where=maliyet > 0)
+    return kar, margin
+
+
+_sensitivity_grid = _sensitivity_kernel if HAS_NUMBA else _sensitivity_broadcast
+
+# Satis ve maliyet icin ayni carpanlar kullanilir
+SENSITIVITY_MULTS = (0.9, 1.0, 1.1)
+_SENSITIVITY_MULTS_ARR = np.array(SENSITIVITY_MULTS, dtype=np.float64)
 
 
 def sensitivity(inputs: Dict[str, Any], usd_try_rate: Optional[float] = None) -> Dict[str, Any]:
@@ -219,37 +440,48 @@ def sensitivity(inputs: Dict[str, Any], usd_try_rate: Optional[float] = None) ->
     Satis ±%10 ve Maliyet ±%10 ile 3x3 duyarlilik tablosu uretir.
     Not: Satis fiyati yoksa, once satis fiyati istemek daha mantikli.
     """
-    base = dict(inputs)
-    base_out, _ = compute_outputs(base, usd_try_rate=usd_try_rate)
+    nums = _coerce_inputs(inputs)
+    base_out, _ = _compute_from_coerced(nums, usd_try_rate)
 
-    sales_mults = [0.9, 1.0, 1.1]
-    cost_mults = [0.9, 1.0, 1.1]
+    sales_mults = list(SENSITIVITY_MULTS)
+    cost_mults = list(SENSITIVITY_MULTS)
 
     # satis fiyati yoksa, duyarlilik grid'i kismen anlamsiz kalir
-    if base.get("satis_birim_fiyat_usd_m2", None) in [None, ""]:
-        return {"base": base_out, "grid": [], "sales_mults": sales_mults, "cost_mults": cost_mults}
-
-    grid = []
-    for cm in cost_mults:
-        row = []
-        for sm in sales_mults:
-            tmp = dict(base)
-            tmp["satis_birim_fiyat_usd_m2"] = float(base["satis_birim_fiyat_usd_m2"]) * sm
-
-            # maliyet birimi override ediliyorsa onu carp
-            if "insaat_maliyet_usd_m2" in tmp and tmp["insaat_maliyet_usd_m2"] not in [None, ""]:
-                tmp["insaat_maliyet_usd_m2"] = float(tmp["insaat_maliyet_usd_m2"]) * cm
-            else:
-                tmp["insaat_maliyet_usd_m2"] = float(DEFAULTS["insaat_maliyet_usd_m2"][tmp["konut_sinifi"]]) * cm
-
-            out, _ = compute_outputs(tmp, usd_try_rate=usd_try_rate)
-            row.append({
+    satis_fiyat = nums.satis_fiyat
+    if satis_fiyat is None:
+        return {"base": base_out.to_dict(), "grid": [], "sales_mults": sales_mults, "cost_mults": cost_mults}
+
+    profit, margin = _sensitivity_grid(
+        base_out.satilabilir_alan_m2,
+        base_out.toplam_insaat_alani_m2,
+        base_out.arsa_degeri_usd,
+        nums.unit_cost,
+        satis_fiyat,
+        _SENSITIVITY_MULTS_ARR,
+        _SENSITIVITY_MULTS_ARR,
+    )
+
+    # compute_outputs gelir modunu yalnizca pozitif satis fiyatinda acar
+    empty_rows = [[None] * len(sales_mults) for _ in cost_mults]
+    if satis_fiyat > 0:
+        profit_rows = profit.tolist()
+        margin_rows = margin.tolist()
+        profit_try_rows = (profit * _f(usd_try_rate)).tolist() if usd_try_rate is not None else empty_rows
+    else:
+        profit_rows = margin_rows = profit_try_rows = empty_rows
+
+    grid = [
+        [
+            {
                 "sales_mult": sm,
                 "cost_mult": cm,
-                "profit_usd": out["proje_kari_usd"],
-                "profit_try": out["proje_kari_try"],
-                "gross_margin": out["brut_karlilik_orani"],
-            })
-        grid.append(row)
+                "profit_usd": kar,
+                "profit_try": kar_try,
+                "gross_margin": gm,
+            }
+            for sm, kar, kar_try, gm in zip(sales_mults, profit_row, profit_try_row, margin_row)
+        ]
+        for cm, profit_row, profit_try_row, margin_row in zip(cost_mults, profit_rows, profit_try_rows, margin_rows)
+    ]
 
-    return {"base": base_out, "grid": grid, "sales_mults": sales_mults, "cost_mults": cost_mults}
+    return {"base": base_out.to_dict(), "grid": grid, "sales_mults": sales_mults, "cost_mults": cost_mults}
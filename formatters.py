@@ -1,7 +1,12 @@
 """
 Formatting utilities for consistent number display with thousand separators
 """
-from typing import Optional
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+# Swaps the English separators for Turkish ones in a single pass: 1,234.56 -> 1.234,56
+_TR_TABLE = str.maketrans({",": ".", ".": ","})
 
 def fmt_int(x: Optional[float], locale: str = "tr") -> str:
     """
@@ -17,13 +22,31 @@ def fmt_int(x: Optional[float], locale: str = "tr") -> str:
     if x is None:
         return "-"
     
-    sep = "." if locale == "tr" else ","
+    # Round to integer and format with separator; "," is already the English one
+    s = f"{int(round(x)):,}"
+    return s.translate(_TR_TABLE) if locale == "tr" else s
+
+
+def fmt_int_array(arr: Union[np.ndarray, Sequence[Optional[float]]], locale: str = "tr") -> List[str]:
+    """
+    fmt_int for a whole array/list in one pass
     
-    # Round to integer
-    num = int(round(x))
+    Args:
+        arr: Numbers to format; None/NaN entries become "-"
+        locale: 'tr' for Turkish (.), 'en' for English (,)
     
-    # Format with separator
-    return f"{num:,}".replace(",", sep)
+    Returns:
+        List of formatted strings, same order as `arr`
+    """
+    values = np.asarray(arr, dtype=np.float64)
+    mask = np.isnan(values)
+    ints = np.rint(np.where(mask, 0.0, values)).astype(np.int64).tolist()
+    out = [f"{v:,}" for v in ints]
+    if locale == "tr":
+        out = [s.translate(_TR_TABLE) for s in out]
+    if mask.any():
+        out = ["-" if m else s for s, m in zip(out, mask.tolist())]
+    return out
 
 
 def fmt_float(x: Optional[float], decimals: int = 2, locale: str = "tr") -> str:
@@ -41,16 +64,9 @@ def fmt_float(x: Optional[float], decimals: int = 2, locale: str = "tr") -> str:
     if x is None:
         return "-"
     
-    if locale == "tr":
-        # Turkish: 1.234,56
-        int_part = int(x)
-        dec_part = abs(x - int_part)
-        int_str = f"{int_part:,}".replace(",", ".")
-        dec_str = f"{dec_part:.{decimals}f}".split(".")[1]
-        return f"{int_str},{dec_str}"
-    else:
-        # English: 1,234.56
-        return f"{x:,.{decimals}f}"
+    # English: 1,234.56 / Turkish: 1.234,56
+    s = f"{x:,.{decimals}f}"
+    return s.translate(_TR_TABLE) if locale == "tr" else s
 
 
 def fmt_usd(x: Optional[float], locale: str = "tr") -> str:
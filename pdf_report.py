@@ -1,18 +1,24 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union, BinaryIO
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
-from reportlab.lib.units import cm, mm
+from reportlab.lib.units import cm
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-    PageBreak, KeepTogether
+    PageBreak
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
+from reportlab.lib.enums import TA_CENTER
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+import io
 import os
+import time
+
+if TYPE_CHECKING:
+    from feasibility import FeasibilityOutputs
 
 # Import formatters for consistent number display
 try:
@@ -42,11 +48,24 @@ LIGHT_BG = colors.HexColor("#F8FAFC")           # Very light gray
 MEDIUM_BG = colors.HexColor("#E2E8F0")          # Light gray
 TEXT_DARK = colors.HexColor("#1E293B")          # Almost black
 TEXT_MUTED = colors.HexColor("#64748B")         # Gray
+TEXT_LIGHT = colors.HexColor("#94A3B8")         # Light gray text
+RED_BG = colors.HexColor("#FEE2E2")             # Light red
+AMBER_BG = colors.HexColor("#FEF3C7")           # Light amber
+BLUE_BG = colors.HexColor("#DBEAFE")            # Light blue
+GREEN_BG = colors.HexColor("#D1FAE5")           # Light green
+
+_FONTS_OK: Optional[bool] = None
 
 def _register_fonts():
     """Register Turkish-compatible fonts with font family - returns True if successful"""
+    global _FONTS_OK
+    # Registration result never changes within a process
+    if _FONTS_OK is None:
+        _FONTS_OK = _register_fonts_once()
+    return _FONTS_OK
+
+def _register_fonts_once():
     try:
-        from reportlab.pdfbase.ttfonts import TTFont
         from reportlab.lib.fonts import addMapping
         
         font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
@@ -61,21 +80,24 @@ def _register_fonts():
         # Try to register fonts
         pdfmetrics.registerFont(TTFont("DejaVu", font_path))
         
-        # Register variants if they exist
-        if os.path.exists(bold_path):
+        # Register variants if they exist (each path is checked once)
+        has_bold = os.path.exists(bold_path)
+        has_italic = os.path.exists(italic_path)
+        has_bold_italic = os.path.exists(bold_italic_path)
+        if has_bold:
             pdfmetrics.registerFont(TTFont("DejaVu-Bold", bold_path))
-        if os.path.exists(italic_path):
+        if has_italic:
             pdfmetrics.registerFont(TTFont("DejaVu-Italic", italic_path))
-        if os.path.exists(bold_italic_path):
+        if has_bold_italic:
             pdfmetrics.registerFont(TTFont("DejaVu-BoldItalic", bold_italic_path))
         
         # Register font family mappings
         addMapping('DejaVu', 0, 0, 'DejaVu')
-        if os.path.exists(bold_path):
+        if has_bold:
             addMapping('DejaVu', 1, 0, 'DejaVu-Bold')
-        if os.path.exists(italic_path):
+        if has_italic:
             addMapping('DejaVu', 0, 1, 'DejaVu-Italic')
-        if os.path.exists(bold_italic_path):
+        if has_bold_italic:
             addMapping('DejaVu', 1, 1, 'DejaVu-BoldItalic')
         
         return True
@@ -84,135 +106,236 @@ def _register_fonts():
         # Any error means fonts not available
         return False
 
+@lru_cache(maxsize=None)
+def _select_fonts() -> Tuple[str, str, str]:
+    """
+    (base, bold, italic) font names for the report, resolved once per process.
+    Fonts installed after the first report are not picked up until restart.
+    """
+    fonts_ok = _register_fonts()
+    
+    # CRITICAL: Safe font selection - use Helvetica if DejaVu not available
+    # This prevents KeyError when fonts are not registered
+    if fonts_ok:
+        # Verify fonts are actually registered before using them
+        registered_fonts = pdfmetrics.getRegisteredFontNames()
+        if "DejaVu" in registered_fonts and "DejaVu-Bold" in registered_fonts:
+            base_font = "DejaVu"
+            bold_font = "DejaVu-Bold"
+            italic_font = "DejaVu-Italic" if "DejaVu-Italic" in registered_fonts else "Helvetica-Oblique"
+        else:
+            # Fonts registration failed, use Helvetica
+            base_font = "Helvetica"
+            bold_font = "Helvetica-Bold"
+            italic_font = "Helvetica-Oblique"
+    else:
+        # DejaVu not available - use Helvetica (always safe)
+        base_font = "Helvetica"
+        bold_font = "Helvetica-Bold"
+        italic_font = "Helvetica-Oblique"
+    return base_font, bold_font, italic_font
+
+_TR_TABLE = str.maketrans({
+    'ı': 'i',
+    'İ': 'I',
+    'ş': 's',
+    'Ş': 'S',
+    'ğ': 'g',
+    'Ğ': 'G',
+    'ü': 'u',
+    'Ü': 'U',
+    'ö': 'o',
+    'Ö': 'O',
+    'ç': 'c',
+    'Ç': 'C',
+})
+
 def tr_to_en(text: str) -> str:
     """
     Convert Turkish characters to English equivalents for PDF compatibility
-    I -> I, i -> i, S -> S, s -> s, G -> G, g -> g, U -> U, u -> u, O -> O, o -> o, C -> C, c -> c
+    ı -> i, İ -> I, ş -> s, Ş -> S, ğ -> g, Ğ -> G, ü -> u, Ü -> U, ö -> o, Ö -> O, ç -> c, Ç -> C
     """
     if not isinstance(text, str):
         return str(text)
-    
-    char_map = {
-        'I': 'I',
-        'i': 'i',
-        'S': 'S',
-        's': 's',
-        'G': 'G',
-        'g': 'g',
-        'U': 'U',
-        'u': 'u',
-        'O': 'O',
-        'o': 'o',
-        'C': 'C',
-        'c': 'c',
-    }
-    
-    result = text
-    for tr_char, en_char in char_map.items():
-        result = result.replace(tr_char, en_char)
-    
-    return result
+    # Most cells (numbers, dates, labels) are plain ASCII
+    if text.isascii():
+        return text
+    return text.translate(_TR_TABLE)
 
+@lru_cache(maxsize=256)
 def money_usd(x: Optional[float]) -> str:
     """Deprecated: Use fmt_usd from formatters instead"""
     return fmt_usd(x)
 
+@lru_cache(maxsize=256)
 def money_try(x: Optional[float]) -> str:
     """Deprecated: Use fmt_try from formatters instead"""
     return fmt_try(x)
 
+@lru_cache(maxsize=256)
 def num(x: Optional[float], d: int = 2) -> str:
     """Format number with decimal places (still used in PDF)"""
     if x is None:
         return "-"
     return f"{x:,.{d}f}"
 
-# Safe Paragraph wrapper that converts Turkish characters
-_OriginalParagraph = Paragraph
-def Paragraph(text, style, **kwargs):
-    """Wrapper around Paragraph that converts Turkish chars to English"""
-    if isinstance(text, str):
-        text = tr_to_en(text)
-    return _OriginalParagraph(text, style, **kwargs)
+def P(text, style, **kwargs) -> Paragraph:
+    """Paragraph with Turkish characters converted to English"""
+    if isinstance(text, str) and not text.isascii():
+        text = text.translate(_TR_TABLE)
+    return Paragraph(text, style, **kwargs)
 
-def create_header_box(text: str, styles) -> Table:
-    """Create a colored header box"""
-    # Convert Turkish chars
-    text = tr_to_en(text)
-    # Don't use  tags - use style instead for Turkish chars
-    p = Paragraph(f"<font color='white'>{text}</font>", styles["HeaderBox"])
-    t = Table([[p]], colWidths=[16*cm])
-    t.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,-1), PRIMARY_COLOR),
-        ("LEFTPADDING", (0,0), (-1,-1), 12),
-        ("RIGHTPADDING", (0,0), (-1,-1), 12),
-        ("TOPPADDING", (0,0), (-1,-1), 10),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 10),
+# Table styles are constant data, so parse them once and share across reports
+_HEADER_BOX_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,-1), PRIMARY_COLOR),
+    ("LEFTPADDING", (0,0), (-1,-1), 12),
+    ("RIGHTPADDING", (0,0), (-1,-1), 12),
+    ("TOPPADDING", (0,0), (-1,-1), 10),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 10),
+    ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+])
+
+_BRAND_BOX_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,-1), PRIMARY_COLOR),
+    ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+    ("TOPPADDING", (0,0), (-1,-1), 20),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 20),
+])
+
+_INFO_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,-1), LIGHT_BG),
+    ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
+    ("LEFTPADDING", (0,0), (-1,-1), 12),
+    ("RIGHTPADDING", (0,0), (-1,-1), 12),
+    ("TOPPADDING", (0,0), (-1,-1), 8),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 8),
+    ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+])
+
+# KPI grid: two rows of two cards, each card is a title/value/subtitle
+# column; a narrow empty column and row separate the cards
+_KPI_COL_WIDTHS = [7.7*cm, 0.6*cm, 7.7*cm]
+_KPI_ROW_HEIGHTS = [0.8*cm, 1.4*cm, 0.8*cm, 0.3*cm, 0.8*cm, 1.4*cm, 0.8*cm]
+
+def _kpi_cell(i: int):
+    """Top-left (row, col) of the i-th KPI card in the grid"""
+    return (i // 2) * 4, (i % 2) * 2
+
+@lru_cache(maxsize=None)
+def _kpi_grid_style(bg_colors) -> TableStyle:
+    cmds = [
+        ("LEFTPADDING", (0,0), (-1,-1), 10),
+        ("RIGHTPADDING", (0,0), (-1,-1), 10),
+        ("TOPPADDING", (0,0), (-1,-1), 2),
+        ("BOTTOMPADDING", (0,0), (-1,-1), 2),
         ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
-    ]))
-    return t
+    ]
+    for i, bg in enumerate(bg_colors):
+        r, c = _kpi_cell(i)
+        cmds.append(("BACKGROUND", (c, r), (c, r + 2), bg))
+    return TableStyle(cmds)
 
-def create_kpi_box(title: str, value: str, subtitle: str, styles, bg_color=LIGHT_BG) -> Table:
-    """Create a KPI metric box"""
-    # Convert Turkish chars
-    title = tr_to_en(title)
-    value = tr_to_en(value)
-    subtitle = tr_to_en(subtitle)
-    
-    title_p = Paragraph(f"<font color='#64748B' size='9'>{title}</font>", styles["Normal"])
-    # Use KPIValue style which has bold font
-    value_p = Paragraph(f"<font color='#1E293B' size='16'>{value}</font>", styles["KPIValue"])
-    subtitle_p = Paragraph(f"<font color='#94A3B8' size='8'>{subtitle}</font>", styles["Normal"])
-    
-    t = Table([[title_p], [value_p], [subtitle_p]], colWidths=[5*cm])
-    t.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,-1), bg_color),
+_PRICING_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,0), PRIMARY_COLOR),
+    ("TEXTCOLOR", (0,0), (-1,0), colors.white),
+    ("BACKGROUND", (0,1), (-1,1), RED_BG),
+    ("BACKGROUND", (0,2), (-1,2), BLUE_BG),
+    ("BACKGROUND", (0,3), (-1,3), GREEN_BG),
+    ("BACKGROUND", (0,4), (-1,4), AMBER_BG),
+    ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
+    ("LEFTPADDING", (0,0), (-1,-1), 10),
+    ("RIGHTPADDING", (0,0), (-1,-1), 10),
+    ("TOPPADDING", (0,0), (-1,-1), 8),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 8),
+    ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+    ("ALIGN", (1,1), (2,-1), "RIGHT"),
+])
+
+@lru_cache(maxsize=None)
+def _revenue_style(profit_bg) -> TableStyle:
+    return TableStyle([
+        ("BACKGROUND", (0,0), (-1,0), PRIMARY_COLOR),
+        ("TEXTCOLOR", (0,0), (-1,0), colors.white),
+        ("BACKGROUND", (0,1), (-1,2), LIGHT_BG),
+        ("BACKGROUND", (0,3), (-1,3), profit_bg),
+        ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
         ("LEFTPADDING", (0,0), (-1,-1), 10),
         ("RIGHTPADDING", (0,0), (-1,-1), 10),
         ("TOPPADDING", (0,0), (-1,-1), 8),
         ("BOTTOMPADDING", (0,0), (-1,-1), 8),
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-        ("ALIGN", (0,0), (-1,-1), "LEFT"),
-    ]))
+        ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+        ("ALIGN", (1,1), (2,-1), "RIGHT"),
+    ])
+
+_AREAS_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,-1), LIGHT_BG),
+    ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
+    ("LEFTPADDING", (0,0), (-1,-1), 10),
+    ("RIGHTPADDING", (0,0), (-1,-1), 10),
+    ("TOPPADDING", (0,0), (-1,-1), 6),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 6),
+    ("ALIGN", (1,0), (1,-1), "RIGHT"),
+])
+
+_COST_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,0), PRIMARY_COLOR),
+    ("TEXTCOLOR", (0,0), (-1,0), colors.white),
+    ("BACKGROUND", (0,1), (-1,2), LIGHT_BG),
+    ("BACKGROUND", (0,3), (-1,3), MEDIUM_BG),
+    ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
+    ("LEFTPADDING", (0,0), (-1,-1), 10),
+    ("RIGHTPADDING", (0,0), (-1,-1), 10),
+    ("TOPPADDING", (0,0), (-1,-1), 8),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 8),
+    ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+    ("ALIGN", (1,1), (2,-1), "RIGHT"),
+])
+
+@lru_cache(maxsize=None)
+def _input_table_style(base_font: str) -> TableStyle:
+    # Data rows are plain strings, so their font comes from the table style
+    return TableStyle([
+        ("BACKGROUND", (0,0), (-1,0), PRIMARY_COLOR),
+        ("TEXTCOLOR", (0,0), (-1,0), colors.white),
+        ("BACKGROUND", (0,1), (-1,-1), LIGHT_BG),
+        ("FONTNAME", (0,1), (-1,-1), base_font),
+        ("FONTSIZE", (0,1), (-1,-1), 9),
+        ("LEADING", (0,1), (-1,-1), 12),
+        ("TEXTCOLOR", (0,1), (-1,-1), TEXT_DARK),
+        ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
+        ("LEFTPADDING", (0,0), (-1,-1), 10),
+        ("RIGHTPADDING", (0,0), (-1,-1), 10),
+        ("TOPPADDING", (0,0), (-1,-1), 6),
+        ("BOTTOMPADDING", (0,0), (-1,-1), 6),
+        ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+        ("ALIGN", (1,1), (1,-1), "RIGHT"),
+    ])
+
+def create_header_box(text: str, styles) -> Table:
+    """Create a colored header box"""
+    # Convert Turkish chars
+    text = tr_to_en(text)
+    # HeaderBox style already sets the white bold font
+    p = Paragraph(text, styles["HeaderBox"])
+    t = Table([[p]], colWidths=[16*cm])
+    t.setStyle(_HEADER_BOX_STYLE)
     return t
 
-def build_pdf(
-    path: str,
-    project_title: str,
-    inputs: Dict[str, Any],
-    outputs: Dict[str, Any],
-    warnings: List[str],
-    usd_try_rate: Optional[float],
-    rate_source: Optional[str],
-):
-    # Convert all Turkish characters to English equivalents
-    project_title = tr_to_en(project_title)
-    rate_source = tr_to_en(rate_source) if rate_source else None
-    warnings = [tr_to_en(w) for w in warnings]
-    
-    fonts_ok = _register_fonts()
-    
-    # CRITICAL: Safe font selection - use Helvetica if DejaVu not available
-    # This prevents KeyError when fonts are not registered
-    if fonts_ok:
-        # Verify fonts are actually registered before using them
-        registered_fonts = pdfmetrics.getRegisteredFontNames()
-        if "DejaVu" in registered_fonts and "DejaVu-Bold" in registered_fonts:
-            base_font = "DejaVu"
-            bold_font = "DejaVu-Bold"
-            italic_font = "DejaVu-Italic" if "DejaVu-Italic" in registered_fonts else "Helvetica-Oblique"
-        else:
-            # Fonts registration failed, use Helvetica
-            base_font = "Helvetica"
-            bold_font = "Helvetica-Bold"
-            italic_font = "Helvetica-Oblique"
-    else:
-        # DejaVu not available - use Helvetica (always safe)
-        base_font = "Helvetica"
-        bold_font = "Helvetica-Bold"
-        italic_font = "Helvetica-Oblique"
+def create_kpi_grid(kpis, styles) -> Table:
+    """Create the 2x2 KPI card grid from (title, value, subtitle, bg_color) tuples"""
+    rows = [[""] * len(_KPI_COL_WIDTHS) for _ in _KPI_ROW_HEIGHTS]
+    for i, (title, value, subtitle, _bg) in enumerate(kpis):
+        r, c = _kpi_cell(i)
+        rows[r][c] = Paragraph(tr_to_en(title), styles["KPITitle"])
+        rows[r + 1][c] = Paragraph(tr_to_en(value), styles["KPIValue"])
+        rows[r + 2][c] = Paragraph(tr_to_en(subtitle), styles["KPISubtitle"])
+    
+    t = Table(rows, colWidths=_KPI_COL_WIDTHS, rowHeights=_KPI_ROW_HEIGHTS)
+    t.setStyle(_kpi_grid_style(tuple(bg for *_, bg in kpis)))
+    return t
 
-    # Custom styles
+def _build_styles(base_font: str, bold_font: str, italic_font: str):
+    """Build the report style sheet for one font family"""
     styles = getSampleStyleSheet()
     
     # Cover page styles
@@ -290,6 +413,22 @@ def build_pdf(
         textColor=TEXT_DARK,
     ))
     
+    styles.add(ParagraphStyle(
+        name="KPITitle",
+        fontName=base_font,
+        fontSize=9,
+        leading=12,
+        textColor=TEXT_MUTED,
+    ))
+    
+    styles.add(ParagraphStyle(
+        name="KPISubtitle",
+        fontName=base_font,
+        fontSize=8,
+        leading=12,
+        textColor=TEXT_LIGHT,
+    ))
+    
     styles.add(ParagraphStyle(
         name="TableHeader",
         fontName=bold_font,
@@ -306,9 +445,125 @@ def build_pdf(
         textColor=TEXT_DARK,
     ))
 
+    return styles
+
+# Styles only depend on the font family, so build both variants once
+_STYLES_DEJAVU = _build_styles("DejaVu", "DejaVu-Bold", "DejaVu-Italic")
+_STYLES_HELVETICA = _build_styles("Helvetica", "Helvetica-Bold", "Helvetica-Oblique")
+
+# Table rows as (label, ..., output keys) so build_pdf can assemble them in one pass
+_PRICING_ROWS = (
+    ("Basabas", "TableHeader", "breakeven_usd_m2", "breakeven_try_m2", "Maliyet karsilama noktasi"),
+    ("%10 Brut Kâr", "TableCell", "target_10_usd_m2", "target_10_try_m2", "Muhafazakar hedef"),
+    ("%30 Brut Kâr", "TableCell", "target_30_usd_m2", "target_30_try_m2", "Dengeli hedef"),
+    ("%50 Brut Kâr", "TableCell", "target_50_usd_m2", "target_50_try_m2", "Agresif hedef"),
+)
+
+_REVENUE_ROWS = (
+    ("Proje Hasilati", "proje_hasilati_usd", "proje_hasilati_try", "TableCell"),
+    ("Toplam Maliyet", "toplam_proje_maliyeti_usd", "toplam_proje_maliyeti_try", "TableCell"),
+    ("Proje Kâri", "proje_kari_usd", "proje_kari_try", "TableHeader"),
+)
+
+_AREA_ROWS = (
+    ("Emsal Insaat Alani", "emsal_insaat_alani_m2"),
+    ("Satilabilir Alan", "satilabilir_alan_m2"),
+    ("Toplam Insaat (Otopark dahil)", "toplam_insaat_alani_m2"),
+)
+
+_COST_ROWS = (
+    ("Arsa Degeri", "arsa_degeri_usd", "arsa_degeri_try"),
+    ("Insaat Maliyeti", "insaat_maliyeti_usd", "insaat_maliyeti_try"),
+)
+
+# Pretty input names for the inputs table
+_INPUT_LABELS = {
+    "arsa_alani_m2": "Arsa Alani",
+    "emsal": "Emsal",
+    "satilabilir_katsayi": "Satilabilir Alan Katsayisi",
+    "otopark_tipi": "Otopark Tipi",
+    "otopark_katsayi": "Otopark Katsayisi",
+    "konut_sinifi": "Konut Sinifi",
+    "insaat_maliyet_usd_m2": "Insaat Maliyeti ($/m²)",
+    "arsa_toplam_degeri_usd": "Arsa Toplam Degeri ($)",
+    "ortalama_konut_m2": "Ortalama Konut Buyuklugu (m²)",
+    "satis_birim_fiyat_usd_m2": "Satis Birim Fiyati ($/m²)",
+}
+
+def _fmt_m2(v) -> str:
+    return f"{float(v):,.0f} m²"
+
+def _fmt_ratio(v) -> str:
+    return f"{float(v):.2f}"
+
+def _fmt_usd(v) -> str:
+    return f"${float(v):,.0f}"
+
+# Input key -> display formatter; keys not listed are shown with str()
+_INPUT_FORMATTER = {
+    "arsa_alani_m2": _fmt_m2,
+    "ortalama_konut_m2": _fmt_m2,
+    "emsal": _fmt_ratio,
+    "satilabilir_katsayi": _fmt_ratio,
+    "otopark_katsayi": _fmt_ratio,
+    "insaat_maliyet_usd_m2": _fmt_usd,
+    "satis_birim_fiyat_usd_m2": _fmt_usd,
+    "arsa_toplam_degeri_usd": _fmt_usd,
+}
+
+# Warning level -> icon shown in front of the warning text
+_WARNING_ICONS = {"danger": "🚩", "warn": "⚠️", "info": "ℹ️"}
+
+def _warning_level(text: str) -> str:
+    """Classify a warning string as danger / warn / info"""
+    if "zarar" in text.lower():
+        return "danger"
+    return "warn" if "⚠️" in text else "info"
+
+# Page footer text and geometry (drawn on every page)
+_FOOTER_LEFT = tr_to_en("GGtech • Dr. Omur Tezcan")
+_FOOTER_MID = tr_to_en("omurtezcan@gmail.com")
+_FOOTER_X0 = 2.0*cm
+_FOOTER_X1 = A4[0] - 2.0*cm
+_FOOTER_XMID = A4[0] / 2
+_FOOTER_LINE_Y = 1.8*cm
+_FOOTER_TEXT_Y = 1.3*cm
+
+def build_pdf(
+    path: Union[str, BinaryIO],
+    project_title: str,
+    inputs: Dict[str, Any],
+    outputs: Union["FeasibilityOutputs", Dict[str, Any]],
+    warnings: List[Union[str, Tuple[str, str]]],
+    usd_try_rate: Optional[float],
+    rate_source: Optional[str],
+):
+    # Convert all Turkish characters to English equivalents
+    project_title = tr_to_en(project_title)
+    rate_source = tr_to_en(rate_source) if rate_source else None
+    # Warnings may arrive pre-classified as (text, level); plain strings are classified here
+    warnings = [
+        (tr_to_en(w), _warning_level(w)) if isinstance(w, str) else (tr_to_en(w[0]), w[1])
+        for w in warnings
+    ]
+
+    # Bind output lookups once; the cost totals appear in several tables
+    get = outputs.get
+    tot_usd_s = money_usd(get("toplam_proje_maliyeti_usd"))
+    tot_try_s = money_try(get("toplam_proje_maliyeti_try"))
+    satis_usd = get("satis_birim_fiyat_usd_m2")
+    # Same rule as FeasibilityOutputs.has_revenue: only a positive sale price yields a margin
+    profit_margin = get("brut_karlilik_orani")
+    
+    base_font, bold_font, italic_font = _select_fonts()
+
+    styles = _STYLES_DEJAVU if base_font == "DejaVu" else _STYLES_HELVETICA
+
     # Document setup
+    # File targets get the finished document in a single write
+    buf = path if hasattr(path, "write") else io.BytesIO()
     doc = SimpleDocTemplate(
-        path, 
+        buf, 
         pagesize=A4,
         leftMargin=2.0*cm, 
         rightMargin=2.0*cm,
@@ -324,57 +579,44 @@ def build_pdf(
     story.append(Spacer(1, 3*cm))
     
     # Logo/Brand area
-    brand_box = Table([[Paragraph("GGtech", styles["CoverTitle"])]], colWidths=[16*cm])
-    brand_box.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,-1), PRIMARY_COLOR),
-        ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
-        ("TOPPADDING", (0,0), (-1,-1), 20),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 20),
-    ]))
+    brand_box = Table([[P("GGtech", styles["CoverTitle"])]], colWidths=[16*cm])
+    brand_box.setStyle(_BRAND_BOX_STYLE)
     story.append(brand_box)
     story.append(Spacer(1, 1*cm))
     
-    story.append(Paragraph("Konut Projesi Fizibilite Raporu", styles["CoverTitle"]))
-    story.append(Paragraph("AI Destekli Analiz", styles["CoverSubtitle"]))
+    story.append(P("Konut Projesi Fizibilite Raporu", styles["CoverTitle"]))
+    story.append(P("AI Destekli Analiz", styles["CoverSubtitle"]))
     story.append(Spacer(1, 2*cm))
     
     # Project info box
     info_data = [
-        [Paragraph("Proje:", styles["BodyBold"]), Paragraph(project_title, styles["Body"])],
-        [Paragraph("Tarih:", styles["BodyBold"]), Paragraph(datetime.now().strftime('%d.%m.%Y'), styles["Body"])],
+        [P("Proje:", styles["BodyBold"]), P(project_title, styles["Body"])],
+        [P("Tarih:", styles["BodyBold"]), P(time.strftime('%d.%m.%Y'), styles["Body"])],
     ]
     if usd_try_rate is not None:
         src = rate_source or "USD/TRY"
         info_data.append([
-            Paragraph("Kur:", styles["BodyBold"]), 
-            Paragraph(f"1 USD = {num(usd_try_rate, 4)} TL ({src})", styles["Body"])
+            P("Kur:", styles["BodyBold"]), 
+            P(f"1 USD = {num(usd_try_rate, 4)} TL ({src})", styles["Body"])
         ])
     
     info_data.append([
-        Paragraph("Hazirlayan:", styles["BodyBold"]),
-        Paragraph("Dr. Omur Tezcan", styles["Body"])
+        P("Hazirlayan:", styles["BodyBold"]),
+        P("Dr. Omur Tezcan", styles["Body"])
     ])
     
     info_table = Table(info_data, colWidths=[4*cm, 12*cm])
-    info_table.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,-1), LIGHT_BG),
-        ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
-        ("LEFTPADDING", (0,0), (-1,-1), 12),
-        ("RIGHTPADDING", (0,0), (-1,-1), 12),
-        ("TOPPADDING", (0,0), (-1,-1), 8),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 8),
-        ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
-    ]))
+    info_table.setStyle(_INFO_STYLE)
     story.append(info_table)
     
     story.append(Spacer(1, 2*cm))
-    story.append(Paragraph(
+    story.append(P(
         "<i>Bu rapor hizli on fizibilite amaclidir. Nihai karar icin detayli proje butcesi ve uzman gorusu onerilir.</i>",
         styles["BodyMuted"]
     ))
     
     story.append(Spacer(1, 0.5*cm))
-    story.append(Paragraph("Iletisim: omurtezcan@gmail.com", styles["BodyMuted"]))
+    story.append(P("Iletisim: omurtezcan@gmail.com", styles["BodyMuted"]))
     
     story.append(PageBreak())
 
@@ -384,46 +626,16 @@ def build_pdf(
     story.append(create_header_box("📊 Ozet", styles))
     story.append(Spacer(1, 0.5*cm))
     
-    # Top 4 KPIs in simple layout
-    kpi_box1 = create_kpi_box(
-        "Satilabilir Alan",
-        f"{num(outputs.get('satilabilir_alan_m2'),0)} m²",
-        "Toplam satilabilir bagimsiz bolum",
-        styles
-    )
-    kpi_box2 = create_kpi_box(
-        "Toplam Insaat Alani",
-        f"{num(outputs.get('toplam_insaat_alani_m2'),0)} m²",
-        "Otopark dahil",
-        styles
-    )
-    kpi_box3 = create_kpi_box(
-        "Toplam Maliyet (USD)",
-        money_usd(outputs.get("toplam_proje_maliyeti_usd")),
-        "Arsa + insaat",
-        styles,
-        bg_color=colors.HexColor("#FEF3C7")
-    )
-    kpi_box4 = create_kpi_box(
-        "Toplam Maliyet (TL)",
-        money_try(outputs.get("toplam_proje_maliyeti_try")),
-        f"Kur: {num(usd_try_rate, 2) if usd_try_rate else '-'}",
-        styles,
-        bg_color=colors.HexColor("#FEF3C7")
-    )
-    
-    # Arrange in 2x2 grid
-    kpi_grid = Table([
-        [kpi_box1, kpi_box2],
-        [kpi_box3, kpi_box4],
-    ], colWidths=[7.8*cm, 7.8*cm], rowHeights=[3*cm, 3*cm])
-    kpi_grid.setStyle(TableStyle([
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-        ("LEFTPADDING", (0,0), (-1,-1), 0),
-        ("RIGHTPADDING", (0,0), (-1,-1), 0),
-        ("TOPPADDING", (0,0), (-1,-1), 0),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 3),
-    ]))
+    # Top 4 KPIs as a 2x2 grid
+    kpi_grid = create_kpi_grid([
+        ("Satilabilir Alan", f"{num(get('satilabilir_alan_m2'),0)} m²",
+         "Toplam satilabilir bagimsiz bolum", LIGHT_BG),
+        ("Toplam Insaat Alani", f"{num(get('toplam_insaat_alani_m2'),0)} m²",
+         "Otopark dahil", LIGHT_BG),
+        ("Toplam Maliyet (USD)", tot_usd_s, "Arsa + insaat", AMBER_BG),
+        ("Toplam Maliyet (TL)", tot_try_s,
+         f"Kur: {num(usd_try_rate, 2) if usd_try_rate else '-'}", AMBER_BG),
+    ], styles)
     story.append(kpi_grid)
     
     story.append(Spacer(1, 0.8*cm))
@@ -431,138 +643,76 @@ def build_pdf(
     # ============================================================
     # PRICING STRATEGY TABLE
     # ============================================================
-    story.append(Paragraph("🎯 Satis Fiyat Stratejisi", styles["SectionHeader"]))
+    story.append(P("🎯 Satis Fiyat Stratejisi", styles["SectionHeader"]))
     story.append(Spacer(1, 0.3*cm))
     
-    pricing_data = [
-        [
-            Paragraph("Hedef", styles["TableHeader"]),
-            Paragraph("USD/m²", styles["TableHeader"]),
-            Paragraph("TL/m²", styles["TableHeader"]),
-            Paragraph("Aciklama", styles["TableHeader"])
-        ],
-        [
-            Paragraph("Basabas", styles["TableHeader"]),
-            Paragraph(f"{num(outputs.get('breakeven_usd_m2'),0)}", styles["TableCell"]),
-            Paragraph(f"{num(outputs.get('breakeven_try_m2'),0)}", styles["TableCell"]),
-            Paragraph("Maliyet karsilama noktasi", styles["BodyMuted"])
-        ],
+    header_style = styles["TableHeader"]
+    cell_style = styles["TableCell"]
+    pricing_data = [[P(h, header_style) for h in ("Hedef", "USD/m²", "TL/m²", "Aciklama")]]
+    pricing_data += [
         [
-            Paragraph("%10 Brut Kâr", styles["TableCell"]),
-            Paragraph(f"{num(outputs.get('target_10_usd_m2'),0)}", styles["TableCell"]),
-            Paragraph(f"{num(outputs.get('target_10_try_m2'),0)}", styles["TableCell"]),
-            Paragraph("Muhafazakar hedef", styles["BodyMuted"])
-        ],
-        [
-            Paragraph("%30 Brut Kâr", styles["TableCell"]),
-            Paragraph(f"{num(outputs.get('target_30_usd_m2'),0)}", styles["TableCell"]),
-            Paragraph(f"{num(outputs.get('target_30_try_m2'),0)}", styles["TableCell"]),
-            Paragraph("Dengeli hedef", styles["BodyMuted"])
-        ],
-        [
-            Paragraph("%50 Brut Kâr", styles["TableCell"]),
-            Paragraph(f"{num(outputs.get('target_50_usd_m2'),0)}", styles["TableCell"]),
-            Paragraph(f"{num(outputs.get('target_50_try_m2'),0)}", styles["TableCell"]),
-            Paragraph("Agresif hedef", styles["BodyMuted"])
-        ],
+            P(label, styles[label_style]),
+            P(num(get(usd_key), 0), cell_style),
+            P(num(get(try_key), 0), cell_style),
+            P(note, styles["BodyMuted"]),
+        ]
+        for label, label_style, usd_key, try_key, note in _PRICING_ROWS
     ]
     
     pricing_table = Table(pricing_data, colWidths=[3*cm, 3*cm, 3*cm, 7*cm])
-    pricing_table.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), PRIMARY_COLOR),
-        ("TEXTCOLOR", (0,0), (-1,0), colors.white),
-        ("BACKGROUND", (0,1), (-1,1), colors.HexColor("#FEE2E2")),
-        ("BACKGROUND", (0,2), (-1,2), colors.HexColor("#DBEAFE")),
-        ("BACKGROUND", (0,3), (-1,3), colors.HexColor("#D1FAE5")),
-        ("BACKGROUND", (0,4), (-1,4), colors.HexColor("#FEF3C7")),
-        ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
-        ("LEFTPADDING", (0,0), (-1,-1), 10),
-        ("RIGHTPADDING", (0,0), (-1,-1), 10),
-        ("TOPPADDING", (0,0), (-1,-1), 8),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 8),
-        ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
-        ("ALIGN", (1,1), (2,-1), "RIGHT"),
-    ]))
+    pricing_table.setStyle(_PRICING_TABLE_STYLE)
     story.append(pricing_table)
     
     story.append(Spacer(1, 0.5*cm))
     
     # Unit count info with proper bold
     unit_info_text = (
-        f"Konut Adedi: ~{int(outputs.get('yaklasik_konut_adedi') or 0)} adet "
+        f"Konut Adedi: ~{int(get('yaklasik_konut_adedi') or 0)} adet "
         f"(Ortalama {num(inputs.get('ortalama_konut_m2', 120), 0)} m²/konut) • "
-        f"Kalan Alan: {num(outputs.get('kalan_satilabilir_alan_m2'),0)} m²"
+        f"Kalan Alan: {num(get('kalan_satilabilir_alan_m2'),0)} m²"
     )
-    unit_info = Paragraph(unit_info_text, styles["BodyBold"])
+    unit_info = P(unit_info_text, styles["BodyBold"])
     story.append(unit_info)
 
     # ============================================================
-    # REVENUE & PROFITABILITY (if sales price exists)
+    # REVENUE & PROFITABILITY (only when a positive sales price gave a margin)
     # ============================================================
-    if outputs.get("satis_birim_fiyat_usd_m2"):
+    if profit_margin is not None:
         story.append(Spacer(1, 0.8*cm))
         story.append(create_header_box("💰 Gelir ve Kârlilik Analizi", styles))
         story.append(Spacer(1, 0.5*cm))
         
         # Selected price
         selected_price_text = (
-            f"Secilen Satis Fiyati: {num(outputs.get('satis_birim_fiyat_usd_m2'),0)} $/m² "
-            f"({num(outputs.get('satis_birim_fiyat_try_m2'),0)} ₺/m²)"
+            f"Secilen Satis Fiyati: {num(satis_usd,0)} $/m² "
+            f"({num(get('satis_birim_fiyat_try_m2'),0)} ₺/m²)"
         )
-        selected_price = Paragraph(selected_price_text, styles["BodyBold"])
+        selected_price = P(selected_price_text, styles["BodyBold"])
         story.append(selected_price)
         story.append(Spacer(1, 0.3*cm))
         
         # Financial metrics in 2 columns
-        revenue_data = [
-            [
-                Paragraph("Metrik", styles["TableHeader"]),
-                Paragraph("USD", styles["TableHeader"]),
-                Paragraph("TL", styles["TableHeader"])
-            ],
+        revenue_data = [[P(h, header_style) for h in ("Metrik", "USD", "TL")]]
+        revenue_data += [
             [
-                Paragraph("Proje Hasilati", styles["TableCell"]),
-                Paragraph(money_usd(outputs.get("proje_hasilati_usd")), styles["TableCell"]),
-                Paragraph(money_try(outputs.get("proje_hasilati_try")), styles["TableCell"])
-            ],
-            [
-                Paragraph("Toplam Maliyet", styles["TableCell"]),
-                Paragraph(money_usd(outputs.get("toplam_proje_maliyeti_usd")), styles["TableCell"]),
-                Paragraph(money_try(outputs.get("toplam_proje_maliyeti_try")), styles["TableCell"])
-            ],
-            [
-                Paragraph("Proje Kâri", styles["TableHeader"]),
-                Paragraph(f"{money_usd(outputs.get('proje_kari_usd'))}", styles["TableHeader"]),
-                Paragraph(f"{money_try(outputs.get('proje_kari_try'))}", styles["TableHeader"])
-            ],
+                P(label, styles[row_style]),
+                P(money_usd(get(usd_key)), styles[row_style]),
+                P(money_try(get(try_key)), styles[row_style]),
+            ]
+            for label, usd_key, try_key, row_style in _REVENUE_ROWS
         ]
         
         revenue_table = Table(revenue_data, colWidths=[5*cm, 5.5*cm, 5.5*cm])
         
         # Color code based on profitability
-        profit_margin = outputs.get("brut_karlilik_orani", 0)
-        if profit_margin < 0:
-            profit_bg = colors.HexColor("#FEE2E2")  # Red
-        elif profit_margin < 0.10:
-            profit_bg = colors.HexColor("#FEF3C7")  # Yellow
-        elif profit_margin < 0.30:
-            profit_bg = colors.HexColor("#DBEAFE")  # Blue
-        else:
-            profit_bg = colors.HexColor("#D1FAE5")  # Green
+        profit_bg = (
+            RED_BG if profit_margin < 0
+            else AMBER_BG if profit_margin < 0.10
+            else BLUE_BG if profit_margin < 0.30
+            else GREEN_BG
+        )
         
-        revenue_table.setStyle(TableStyle([
-            ("BACKGROUND", (0,0), (-1,0), PRIMARY_COLOR),
-            ("TEXTCOLOR", (0,0), (-1,0), colors.white),
-            ("BACKGROUND", (0,1), (-1,2), LIGHT_BG),
-            ("BACKGROUND", (0,3), (-1,3), profit_bg),
-            ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
-            ("LEFTPADDING", (0,0), (-1,-1), 10),
-            ("RIGHTPADDING", (0,0), (-1,-1), 10),
-            ("TOPPADDING", (0,0), (-1,-1), 8),
-            ("BOTTOMPADDING", (0,0), (-1,-1), 8),
-            ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
-            ("ALIGN", (1,1), (2,-1), "RIGHT"),
-        ]))
+        revenue_table.setStyle(_revenue_style(profit_bg))
         story.append(revenue_table)
         
         story.append(Spacer(1, 0.3*cm))
@@ -578,7 +728,7 @@ def build_pdf(
         else:
             profit_text += " ✓✓ Iyi"
         
-        story.append(Paragraph(profit_text, styles["BodyBold"]))
+        story.append(P(profit_text, styles["BodyBold"]))
 
     story.append(PageBreak())
 
@@ -589,64 +739,28 @@ def build_pdf(
     story.append(Spacer(1, 0.5*cm))
     
     # Areas breakdown
-    story.append(Paragraph("Alan Dagilimi", styles["SectionHeader"]))
-    areas_data = [
-        ["Emsal Insaat Alani", f"{num(outputs.get('emsal_insaat_alani_m2'),0)} m²"],
-        ["Satilabilir Alan", f"{num(outputs.get('satilabilir_alan_m2'),0)} m²"],
-        ["Toplam Insaat (Otopark dahil)", f"{num(outputs.get('toplam_insaat_alani_m2'),0)} m²"],
-    ]
+    story.append(P("Alan Dagilimi", styles["SectionHeader"]))
+    areas_data = [[label, f"{num(get(key),0)} m²"] for label, key in _AREA_ROWS]
     areas_table = Table(areas_data, colWidths=[10*cm, 6*cm])
-    areas_table.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,-1), LIGHT_BG),
-        ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
-        ("LEFTPADDING", (0,0), (-1,-1), 10),
-        ("RIGHTPADDING", (0,0), (-1,-1), 10),
-        ("TOPPADDING", (0,0), (-1,-1), 6),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 6),
-        ("ALIGN", (1,0), (1,-1), "RIGHT"),
-    ]))
+    areas_table.setStyle(_AREAS_STYLE)
     story.append(areas_table)
     
     story.append(Spacer(1, 0.5*cm))
     
     # Cost breakdown
-    story.append(Paragraph("Maliyet Dagilimi", styles["SectionHeader"]))
-    cost_data = [
-        [
-            Paragraph("Kalem", styles["TableHeader"]),
-            Paragraph("USD", styles["TableHeader"]),
-            Paragraph("TL", styles["TableHeader"])
-        ],
-        [
-            "Arsa Degeri",
-            money_usd(outputs.get("arsa_degeri_usd")),
-            money_try(outputs.get("arsa_degeri_try"))
-        ],
-        [
-            "Insaat Maliyeti",
-            money_usd(outputs.get("insaat_maliyeti_usd")),
-            money_try(outputs.get("insaat_maliyeti_try"))
-        ],
-        [
-            Paragraph("Toplam", styles["TableHeader"]),
-            Paragraph(f"{money_usd(outputs.get('toplam_proje_maliyeti_usd'))}", styles["TableHeader"]),
-            Paragraph(f"{money_try(outputs.get('toplam_proje_maliyeti_try'))}", styles["TableHeader"])
-        ],
+    story.append(P("Maliyet Dagilimi", styles["SectionHeader"]))
+    cost_data = [[P(h, header_style) for h in ("Kalem", "USD", "TL")]]
+    cost_data += [
+        [label, money_usd(get(usd_key)), money_try(get(try_key))]
+        for label, usd_key, try_key in _COST_ROWS
     ]
+    cost_data.append([
+        P("Toplam", header_style),
+        P(tot_usd_s, header_style),
+        P(tot_try_s, header_style),
+    ])
     cost_table = Table(cost_data, colWidths=[6*cm, 5*cm, 5*cm])
-    cost_table.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), PRIMARY_COLOR),
-        ("TEXTCOLOR", (0,0), (-1,0), colors.white),
-        ("BACKGROUND", (0,1), (-1,2), LIGHT_BG),
-        ("BACKGROUND", (0,3), (-1,3), MEDIUM_BG),
-        ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
-        ("LEFTPADDING", (0,0), (-1,-1), 10),
-        ("RIGHTPADDING", (0,0), (-1,-1), 10),
-        ("TOPPADDING", (0,0), (-1,-1), 8),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 8),
-        ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
-        ("ALIGN", (1,1), (2,-1), "RIGHT"),
-    ]))
+    cost_table.setStyle(_COST_TABLE_STYLE)
     story.append(cost_table)
 
     # ============================================================
@@ -654,12 +768,11 @@ def build_pdf(
     # ============================================================
     if warnings:
         story.append(Spacer(1, 0.8*cm))
-        story.append(Paragraph("⚠️ Uyarilar ve Notlar", styles["SectionHeader"]))
+        story.append(P("⚠️ Uyarilar ve Notlar", styles["SectionHeader"]))
         story.append(Spacer(1, 0.3*cm))
         
-        for w in warnings:
-            icon = "🚩" if "zarar" in w.lower() else "⚠️" if "⚠️" in w else "ℹ️"
-            warning_p = Paragraph(f"{icon} {w}", styles["Body"])
+        for w, level in warnings:
+            warning_p = P(f"{_WARNING_ICONS[level]} {w}", styles["Body"])
             story.append(warning_p)
             story.append(Spacer(1, 0.2*cm))
 
@@ -671,61 +784,23 @@ def build_pdf(
     story.append(create_header_box("📝 Girdiler ve Kabuller", styles))
     story.append(Spacer(1, 0.5*cm))
     
-    # Pretty input names
-    input_labels = {
-        "arsa_alani_m2": "Arsa Alani",
-        "emsal": "Emsal",
-        "satilabilir_katsayi": "Satilabilir Alan Katsayisi",
-        "otopark_tipi": "Otopark Tipi",
-        "otopark_katsayi": "Otopark Katsayisi",
-        "konut_sinifi": "Konut Sinifi",
-        "insaat_maliyet_usd_m2": "Insaat Maliyeti ($/m²)",
-        "arsa_toplam_degeri_usd": "Arsa Toplam Degeri ($)",
-        "ortalama_konut_m2": "Ortalama Konut Buyuklugu (m²)",
-        "satis_birim_fiyat_usd_m2": "Satis Birim Fiyati ($/m²)",
-    }
-    
     input_rows = [
-        [Paragraph("Parametre", styles["TableHeader"]), 
-         Paragraph("Deger", styles["TableHeader"])]
+        [P("Parametre", styles["TableHeader"]), 
+         P("Deger", styles["TableHeader"])]
     ]
     
     for k, v in inputs.items():
-        label = input_labels.get(k, k)
-        value_str = str(v)
-        
-        # Format numbers nicely
-        if k in ["arsa_alani_m2", "ortalama_konut_m2"]:
-            value_str = f"{float(v):,.0f} m²"
-        elif k in ["emsal", "satilabilir_katsayi", "otopark_katsayi"]:
-            value_str = f"{float(v):.2f}"
-        elif k in ["insaat_maliyet_usd_m2", "satis_birim_fiyat_usd_m2"]:
-            value_str = f"${float(v):,.0f}"
-        elif k == "arsa_toplam_degeri_usd":
-            value_str = f"${float(v):,.0f}"
-        
-        input_rows.append([
-            Paragraph(label, styles["TableCell"]),
-            Paragraph(value_str, styles["TableCell"])
-        ])
+        label = _INPUT_LABELS.get(k, k)
+        # Optional inputs (e.g. sale price) may be left empty
+        value_str = "-" if v is None or v == "" else _INPUT_FORMATTER.get(k, str)(v)
+        input_rows.append([tr_to_en(label), tr_to_en(value_str)])
     
     input_table = Table(input_rows, colWidths=[10*cm, 6*cm])
-    input_table.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), PRIMARY_COLOR),
-        ("TEXTCOLOR", (0,0), (-1,0), colors.white),
-        ("BACKGROUND", (0,1), (-1,-1), LIGHT_BG),
-        ("GRID", (0,0), (-1,-1), 0.5, MEDIUM_BG),
-        ("LEFTPADDING", (0,0), (-1,-1), 10),
-        ("RIGHTPADDING", (0,0), (-1,-1), 10),
-        ("TOPPADDING", (0,0), (-1,-1), 6),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 6),
-        ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
-        ("ALIGN", (1,1), (1,-1), "RIGHT"),
-    ]))
+    input_table.setStyle(_input_table_style(base_font))
     story.append(input_table)
     
     story.append(Spacer(1, 1*cm))
-    story.append(Paragraph(
+    story.append(P(
         "<i>Not: Bu rapordaki tum hesaplamalar yukaridaki girdilere ve kabullere dayanmaktadir. "
         "Gercek sonuclar piyasa kosullari, proje yonetimi ve diger faktorler nedeniyle farklilik gosterebilir.</i>",
         styles["BodyMuted"]
@@ -734,21 +809,48 @@ def build_pdf(
     # ============================================================
     # BUILD PDF with custom footer
     # ============================================================
-    def footer(canvas, doc_):
+    def footer(canvas, doc_, _font=base_font, _left=_FOOTER_LEFT, _mid=_FOOTER_MID):
         canvas.saveState()
         
         # Footer line
         canvas.setStrokeColor(MEDIUM_BG)
         canvas.setLineWidth(1)
-        canvas.line(2.0*cm, 1.8*cm, A4[0]-2.0*cm, 1.8*cm)
+        canvas.line(_FOOTER_X0, _FOOTER_LINE_Y, _FOOTER_X1, _FOOTER_LINE_Y)
         
         # Footer text
-        canvas.setFont(base_font, 9)
+        canvas.setFont(_font, 9)
         canvas.setFillColor(TEXT_MUTED)
-        canvas.drawString(2.0*cm, 1.3*cm, "GGtech • Dr. Omur Tezcan")
-        canvas.drawCentredString(A4[0]/2, 1.3*cm, "omurtezcan@gmail.com")
-        canvas.drawRightString(A4[0]-2.0*cm, 1.3*cm, f"Sayfa {doc_.page}")
+        canvas.drawString(_FOOTER_X0, _FOOTER_TEXT_Y, _left)
+        canvas.drawCentredString(_FOOTER_XMID, _FOOTER_TEXT_Y, _mid)
+        canvas.drawRightString(_FOOTER_X1, _FOOTER_TEXT_Y, f"Sayfa {doc_.page}")
         
         canvas.restoreState()
 
     doc.build(story, onFirstPage=footer, onLaterPages=footer)
+    if buf is not path:
+        with open(path, "wb") as f:
+            f.write(buf.getbuffer())
+
+def _build_one(job: Dict[str, Any]) -> str:
+    """Build one report from a dict of build_pdf keyword arguments"""
+    build_pdf(**job)
+    return job["path"]
+
+def _available_cpus() -> int:
+    # Respect CPU affinity (containers, taskset) where the platform exposes it
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def build_pdfs_parallel(jobs: List[Dict[str, Any]]) -> List[str]:
+    """
+    Build many reports across processes; returns the output paths in job order.
+    Each job holds build_pdf keyword arguments and its "path" must be a file path.
+    ReportLab layout is CPU-bound Python, so processes scale where threads would not.
+    """
+    workers = min(_available_cpus(), len(jobs))
+    if workers < 2:
+        return [_build_one(job) for job in jobs]
+    # Fonts are registered once per worker instead of on its first report
+    with ProcessPoolExecutor(max_workers=workers, initializer=_register_fonts) as ex:
+        return list(ex.map(_build_one, jobs, chunksize=4))